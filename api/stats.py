@@ -25,7 +25,7 @@ class handler(BaseHTTPRequestHandler):
             stats_data = get_statistics()
 
             # Calculate distributions in the target timezone
-            distributions = calculate_distributions(stats_data['all_timestamps'], timezone_name)
+            distributions = calculate_distributions(stats_data['half_hour_counts'], timezone_name)
 
             # Convert earliest and latest to target timezone
             earliest = convert_to_timezone(stats_data['earliest'], timezone_name) if stats_data['earliest'] else None
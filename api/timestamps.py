@@ -8,7 +8,7 @@ from urllib.parse import urlparse, parse_qs
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.database_sqlite import get_timestamps_for_date_range
-from utils.timezone_utils import convert_to_timezone, get_date_range_for_timezone, TIMEZONES
+from utils.timezone_utils import format_timestamp_rows, get_date_range_for_timezone, TIMEZONES
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
@@ -25,28 +25,28 @@ class handler(BaseHTTPRequestHandler):
                 timezone_name = 'IST'
 
             # Get date range
-            start_date, end_date, start_date_ist, end_date_ist = get_date_range_for_timezone(
-                start_date_str, end_date_str, timezone_name
-            )
+            try:
+                start_date, end_date, start_date_ist, end_date_ist = get_date_range_for_timezone(
+                    start_date_str, end_date_str, timezone_name
+                )
+            except ValueError:
+                error_response = {
+                    'success': False,
+                    'error': 'start_date and end_date must be ISO 8601 timestamps'
+                }
+
+                self.send_response(400)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(json.dumps(error_response).encode())
+                return
 
             # Get data from database
             results = get_timestamps_for_date_range(start_date_ist, end_date_ist)
 
             # Convert timestamps to target timezone and format
-            timestamps = []
-            for row in results:
-                timestamp = row['post_timestamp_parsed']
-                converted = convert_to_timezone(timestamp, timezone_name)
-                if converted:
-                    timestamps.append({
-                        'datetime': converted.isoformat(),
-                        'day': converted.strftime('%A'),
-                        'hour': converted.hour,
-                        'minute': converted.minute,
-                        'date': converted.strftime('%Y-%m-%d'),
-                        'question_text': row['question_text'] or 'No question text',
-                        'answer_url': row['answered_question_url'] or '#'
-                    })
+            timestamps = format_timestamp_rows(results, timezone_name)
 
             response_data = {
                 'success': True,
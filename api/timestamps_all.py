@@ -8,7 +8,7 @@ from urllib.parse import urlparse, parse_qs
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.database_sqlite import get_all_timestamps
-from utils.timezone_utils import convert_to_timezone, TIMEZONES
+from utils.timezone_utils import convert_timestamps_to_iso, TIMEZONES
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
@@ -25,12 +25,7 @@ class handler(BaseHTTPRequestHandler):
             results = get_all_timestamps()
 
             # Convert to target timezone
-            timestamps = []
-            for row in results:
-                timestamp = row['post_timestamp_parsed']
-                converted = convert_to_timezone(timestamp, timezone_name)
-                if converted:
-                    timestamps.append(converted.isoformat())
+            timestamps = convert_timestamps_to_iso(results, timezone_name)
 
             response_data = {
                 'success': True,
@@ -8,11 +8,12 @@ import sys
 import time
 import logging
 from datetime import datetime
-import pytz
-from selenium.webdriver.common.by import By
-import html2text
 from .database_sqlite import DatabaseManager
 from .chrome_driver_manager import get_chrome_manager
+from .common import (
+    html_to_markdown, parse_quora_timestamp, wait_for_selector, build_answer_update, write_answer_updates,
+    QUESTION_TITLE_SELECTOR, REVISION_LINK_SELECTOR, ANSWER_PAGE_SCRIPT, LOG_PAGE_SCRIPT, DB_BATCH_SIZE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ class QuoraAnswerProcessor:
         self.success_count = 0
         self.total_entries = 0
         self.failed_urls = []
+        self.pending_updates = []  # Extracted answers waiting for the next batch write
         self.setup_file_logging()
 
     def setup_file_logging(self):
@@ -115,27 +117,14 @@ class QuoraAnswerProcessor:
                     if answer_data:
                         # Double-check critical fields before database update
                         if answer_data.get('question_text') and answer_data.get('answer_content'):
-                            # Update database with extracted data
-                            success = self.db_manager.update_answer_data(
-                                answered_question_url=answered_question_url,
-                                question_url=answer_data.get('question_url'),
-                                question_text=answer_data.get('question_text'),
-                                answer_content=answer_data.get('answer_content'),
-                                revision_link=answer_data.get('revision_link'),
-                                post_timestamp_raw=answer_data.get('post_timestamp_raw'),
-                                post_timestamp_parsed=answer_data.get('post_timestamp_parsed')
-                            )
+                            # Buffer the update - it is written with the next batch
+                            self.pending_updates.append(build_answer_update(answered_question_url, answer_data))
+                            if len(self.pending_updates) >= DB_BATCH_SIZE:
+                                self.flush_pending_updates()
                         else:
                             # Critical fields missing - don't update database
-                            success = False
-                            self.url_logger.error(f"FAILED (Missing critical fields): {answered_question_url}")
-
-                        if success:
-                            self.success_count += 1
-                            self.url_logger.info("SUCCESS")
-                        else:
                             self.failed_urls.append(answered_question_url)
-                            self.url_logger.error(f"FAILED (DB Update): {answered_question_url}")
+                            self.url_logger.error(f"FAILED (Missing critical fields): {answered_question_url}")
                             self.update_progress(answered_question_url, failed=True)
                     else:
                         self.failed_urls.append(answered_question_url)
@@ -154,7 +143,10 @@ class QuoraAnswerProcessor:
                     self.update_progress(answered_question_url, failed=True)
                     self.processed_count += 1
                     continue
-            
+
+            # Write the last partial batch
+            self.flush_pending_updates()
+
             # Final summary
             print()  # New line after progress updates
 
@@ -182,9 +174,25 @@ class QuoraAnswerProcessor:
             
         finally:
             if self.db_manager:
+                # Don't lose answers extracted before an interruption
+                try:
+                    self.flush_pending_updates()
+                except Exception as e:
+                    logger.error(f"Error writing pending updates: {e}")
                 self.db_manager.disconnect()
             self.chrome_manager.cleanup()
 
+    def flush_pending_updates(self):
+        """Write buffered answer updates in one transaction and record the results"""
+        self.success_count += write_answer_updates(
+            self.db_manager, self.pending_updates, self.record_failed_update, self.url_logger
+        )
+
+    def record_failed_update(self, url: str):
+        """Track an answer whose database update failed"""
+        self.failed_urls.append(url)
+        self.update_progress(url, failed=True)
+
     def extract_answer_data(self, answered_question_url: str) -> dict:
         """Extract all required data from an answer page"""
         try:
@@ -193,7 +201,8 @@ class QuoraAnswerProcessor:
 
             # Navigate to the answer page
             self.chrome_manager.get_driver().get(answered_question_url)
-            time.sleep(3)  # Wait for page to load
+            if not wait_for_selector(self.chrome_manager.get_driver(), QUESTION_TITLE_SELECTOR):
+                self.url_logger.warning(f"Timed out waiting for answer page: {answered_question_url}")
 
             answer_data = {}
 
@@ -201,68 +210,28 @@ class QuoraAnswerProcessor:
             answer_data['answered_question_url'] = cleaned_url
             answered_question_url = cleaned_url
             
-            # Extract question URL
-            try:
-                question_url_element = self.chrome_manager.get_driver().find_element(By.CSS_SELECTOR, "a.puppeteer_test_link:has(.puppeteer_test_question_title)")
-                answer_data['question_url'] = question_url_element.get_attribute('href')
-            except Exception as e:
-                logger.debug(f"Could not extract question URL: {e}")
-                answer_data['question_url'] = None
-            
-            # Extract question text
-            try:
-                question_text_element = self.chrome_manager.get_driver().find_element(By.CSS_SELECTOR, ".puppeteer_test_question_title span")
-                answer_data['question_text'] = question_text_element.text.strip()
-            except Exception as e:
-                logger.debug(f"Could not extract question text: {e}")
-                answer_data['question_text'] = None
-            
-            # Extract answer content and convert to markdown
-            # self.chrome_manager.get_driver().find_element(By.CSS_SELECTOR, "div.q-text[style*='max-width: 100%'] span.q-box.qu-userSelect--text").get_attribute('innerHTML')
-            try:
-                answer_content_element = self.chrome_manager.get_driver().find_element(By.CSS_SELECTOR, "div.q-text[style*='max-width: 100%'] span.q-box.qu-userSelect--text")
-                answer_html = answer_content_element.get_attribute('innerHTML')
-
-                # Configure html2text converter
-                h = html2text.HTML2Text()
-                h.ignore_links = False
-                h.ignore_images = False
-                h.body_width = 0  # Don't wrap lines
-                answer_markdown = h.handle(answer_html)
-                
-                answer_data['answer_content'] = answer_markdown.strip()
-            except Exception as e:
-                logger.debug(f"Could not extract answer content: {e}")
-                answer_data['answer_content'] = None
+            # Extract question URL, question text and answer HTML in one script call
+            page_data = self.chrome_manager.get_driver().execute_script("return " + ANSWER_PAGE_SCRIPT.strip()) or {}
+            answer_data['question_url'] = page_data.get('question_url')
+            answer_data['question_text'] = page_data.get('question_text')
+
+            # Convert answer content to markdown
+            answer_html = page_data.get('answer_html')
+            answer_data['answer_content'] = html_to_markdown(answer_html) if answer_html else None
             
             # Extract revision data from log page
             log_url = f"{answered_question_url}/log"
             try:
                 self.chrome_manager.get_driver().get(log_url)
-                time.sleep(2)
+                wait_for_selector(self.chrome_manager.get_driver(), REVISION_LINK_SELECTOR)
                 
-                # Extract revision link
-                try:
-                    revision_link_element = self.chrome_manager.get_driver().find_element(By.CSS_SELECTOR, "a.puppeteer_test_link[href*='/log/revision/']")
-                    answer_data['revision_link'] = revision_link_element.get_attribute('href')
-                except Exception as e:
-                    logger.debug(f"Could not extract revision link: {e}")
-                    answer_data['revision_link'] = None
-                
-                # Extract post timestamp
-                try:
-                    timestamp_element = self.chrome_manager.get_driver().find_element(By.CSS_SELECTOR, "span.c1h7helg.c8970ew:last-child")
-                    timestamp_raw = timestamp_element.text.strip()
-                    answer_data['post_timestamp_raw'] = timestamp_raw
-                    
-                    # Parse timestamp
-                    parsed_timestamp = self.parse_quora_timestamp(timestamp_raw)
-                    answer_data['post_timestamp_parsed'] = parsed_timestamp
-                    
-                except Exception as e:
-                    logger.debug(f"Could not extract timestamp: {e}")
-                    answer_data['post_timestamp_raw'] = None
-                    answer_data['post_timestamp_parsed'] = None
+                # Extract revision link and post timestamp in one script call
+                log_data = self.chrome_manager.get_driver().execute_script("return " + LOG_PAGE_SCRIPT.strip()) or {}
+                answer_data['revision_link'] = log_data.get('revision_link')
+
+                timestamp_raw = log_data.get('timestamp_raw')
+                answer_data['post_timestamp_raw'] = timestamp_raw
+                answer_data['post_timestamp_parsed'] = self.parse_quora_timestamp(timestamp_raw)
                     
             except Exception as e:
                 logger.debug(f"Could not access log page {log_url}: {e}")
@@ -283,21 +252,10 @@ class QuoraAnswerProcessor:
     
     def parse_quora_timestamp(self, timestamp_str: str):
         """Convert Quora timestamp string to datetime object timezone"""
-        if not timestamp_str:
-            return None
-            
-        try:
-            # Parse the timestamp string (e.g., "June 27, 2025 at 10:26:56 PM")
-            dt = datetime.strptime(timestamp_str, "%B %d, %Y at %I:%M:%S %p")
-            
-            # Set timezone to Indian Standard Time (IST)
-            ist = pytz.timezone('Asia/Kolkata')
-            dt_with_tz = ist.localize(dt)
-            
-            return dt_with_tz
-        except ValueError as e:
-            logger.error(f"Error parsing timestamp: {timestamp_str} - {e}")
-            return None
+        parsed = parse_quora_timestamp(timestamp_str)
+        if timestamp_str and parsed is None:
+            logger.error(f"Error parsing timestamp: {timestamp_str}")
+        return parsed
 
 
 def run_answer_processor():
@@ -6,6 +6,8 @@ Eliminates code duplication across middleware, answer_processor, and spider
 
 import os
 import time
+import shutil
+import functools
 import logging
 import platform
 import subprocess
@@ -19,6 +21,65 @@ from .common import check_quora_authentication
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session for Chrome's DevTools endpoints - keeps the connection alive between calls
+cdp_session = requests.Session()
+
+# Chrome profile kept outside /tmp so the Quora login survives reboots and later runs
+CHROME_PROFILE_DIR = os.getenv('CHROME_PROFILE_DIR', os.path.expanduser('~/.quora_scraper_profile'))
+
+# Resources the scraper never needs - blocking them makes Quora pages load sooner
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm"
+]
+
+# Keep background tabs and unfocused windows running at full speed - parallel workers each
+# drive their own tab, and only one of them can be in front - and turn off unused subsystems
+CHROME_PERFORMANCE_FLAGS = [
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-features=Translate',
+    '--disable-sync',
+    '--mute-audio',
+]
+
+MAC_CHROME_PATH = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+
+# Tried in order after the macOS app path
+CHROME_PATH_CANDIDATES = (
+    '/usr/bin/google-chrome',
+    '/usr/bin/chromium-browser',
+    'google-chrome',
+    'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
+    'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def find_chrome_path() -> str:
+    """Locate the Chrome binary once per process, falling back to the macOS app path"""
+    if os.path.exists(MAC_CHROME_PATH):
+        return MAC_CHROME_PATH
+    for candidate in CHROME_PATH_CANDIDATES:
+        path = shutil.which(candidate)
+        if path:
+            return path
+    return MAC_CHROME_PATH
+
+
+def wait_for_debugging_endpoint(debug_port: int, timeout: float = 5) -> bool:
+    """Poll Chrome's DevTools endpoint until it answers or the timeout expires"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if cdp_session.get(f'http://localhost:{debug_port}/json/version', timeout=0.5).ok:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.1)
+    return False
+
 
 class ChromeDriverManager:
     """Centralized Chrome driver management for Quora scraper"""
@@ -35,8 +96,15 @@ class ChromeDriverManager:
     def setup_driver(self):
         """Setup Chrome driver - try CDP connection first, then fallback to new instance"""
         if self.driver is not None:
-            logger.info("Chrome driver already initialized")
-            return True
+            try:
+                # Reuse the existing session as long as Chrome still answers on it
+                self.driver.current_url
+                logger.info("Chrome driver already initialized")
+                return True
+            except Exception:
+                logger.warning("Existing Chrome session is no longer usable, reconnecting")
+                self.driver = None
+                self.authenticated = False
 
         logger.info("Setting up Chrome driver...")
 
@@ -66,7 +134,7 @@ class ChromeDriverManager:
             logger.info(f'Attempting to connect to Chrome via CDP at {cdp_url}...')
 
             # Check if Chrome is running with remote debugging
-            response = requests.get(f'{cdp_url}/json', timeout=5)
+            response = cdp_session.get(f'{cdp_url}/json', timeout=5)
             if response.status_code == 200:
                 tabs_info = response.json()
                 logger.debug(f"Found existing Chrome instance with {len(tabs_info)} tabs on port {self.debug_port}")
@@ -117,42 +185,24 @@ class ChromeDriverManager:
                 subprocess.run(['brew', 'install', '--cask', 'google-chrome'],
                              capture_output=True, check=False)
 
-                chrome_path = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-            else:
-                # For Intel Macs and other systems
-                chrome_path = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-                if not os.path.exists(chrome_path):
-                    # Try common Chrome paths
-                    possible_paths = [
-                        '/usr/bin/google-chrome',
-                        '/usr/bin/chromium-browser',
-                        'google-chrome'
-                    ]
-                    for path in possible_paths:
-                        if os.path.exists(path) or subprocess.run(['which', path],
-                                                                capture_output=True).returncode == 0:
-                            chrome_path = path
-                            break
+            chrome_path = find_chrome_path()
 
             # Start Chrome with remote debugging
             chrome_cmd = [
                 chrome_path,
                 f'--remote-debugging-port={self.debug_port}',
-                '--user-data-dir=/tmp/chrome_debug_profile',
+                f'--user-data-dir={CHROME_PROFILE_DIR}',
                 '--no-first-run',
                 '--no-default-browser-check',
-                '--disable-default-apps'
+                '--disable-default-apps',
+                *CHROME_PERFORMANCE_FLAGS
             ]
 
             logger.info(f"Starting Chrome with command: {' '.join(chrome_cmd)}")
             subprocess.Popen(chrome_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-            # Wait for Chrome to start
-            time.sleep(3)
-
-            # Verify Chrome started with debugging
-            response = requests.get(f'http://localhost:{self.debug_port}/json', timeout=5)
-            if response.status_code == 200:
+            # Wait until Chrome accepts debugging connections
+            if wait_for_debugging_endpoint(self.debug_port):
                 logger.info("Chrome started successfully with remote debugging")
                 return True
             else:
@@ -220,6 +270,21 @@ class ChromeDriverManager:
 
         return self.authenticated
 
+    def block_heavy_resources(self):
+        """Block images, fonts and media in the driven tab"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
+        except Exception as e:
+            logger.debug(f"Could not block resources on port {self.debug_port}: {e}")
+
+    def unblock_resources(self):
+        """Lift the resource blocking set by block_heavy_resources"""
+        try:
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+        except Exception as e:
+            logger.debug(f"Could not unblock resources on port {self.debug_port}: {e}")
+
     def get_driver(self):
         """Get the Chrome driver instance, setting it up if necessary"""
         if self.driver is None:
@@ -3,11 +3,79 @@
 Common utilities for Quora scraper
 """
 
+import re
+import json
 import logging
+from datetime import datetime
+import html2text
+import pytz
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
 logger = logging.getLogger(__name__)
 
+# Maximum time to wait for the question title / revision link that signal a page has rendered
+PAGE_LOAD_TIMEOUT = 10
+
+# Number of extracted answers written to the database in one transaction
+DB_BATCH_SIZE = 25
+
+# Quora post timestamps look like "June 27, 2025 at 10:26:56 PM" and are shown in IST
+QUORA_TIMESTAMP_PATTERN = re.compile(r'([A-Z][a-z]+) (\d{1,2}), (\d{4}) at (\d{1,2}):(\d{2}):(\d{2}) ([AP]M)')
+MONTH_NUMBERS = {name: number for number, name in enumerate(
+    ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+     'August', 'September', 'October', 'November', 'December'], start=1)}
+IST = pytz.timezone('Asia/Kolkata')
+
+# CSS selectors for the fields extracted from answer and log pages
+QUESTION_LINK_SELECTOR = "a.puppeteer_test_link:has(.puppeteer_test_question_title)"
+QUESTION_TITLE_SELECTOR = ".puppeteer_test_question_title span"
+ANSWER_CONTENT_SELECTOR = "div.q-text[style*='max-width: 100%'] span.q-box.qu-userSelect--text"
+REVISION_LINK_SELECTOR = "a.puppeteer_test_link[href*='/log/revision/']"
+TIMESTAMP_SELECTOR = "span.c1h7helg.c8970ew:last-child"
+
+# Page extraction scripts - each returns every field a page offers in one CDP round-trip
+ANSWER_PAGE_SCRIPT = """
+(() => {
+    const KEPT_ATTRIBUTES = new Set(['href', 'src', 'alt', 'title', 'width', 'height', 'start']);
+    const questionLink = document.querySelector(%s);
+    const questionTitle = document.querySelector(%s);
+    const answerContent = document.querySelector(%s);
+    let answerHtml = null;
+    if (answerContent) {
+        // Drop the class/style attributes Quora puts on every node - html2text ignores
+        // them but still has to parse them, and they make up most of the markup
+        const clone = answerContent.cloneNode(true);
+        // Icons and inline scripts/styles carry no answer text
+        clone.querySelectorAll('svg, script, style').forEach((el) => el.remove());
+        for (const el of clone.querySelectorAll('*')) {
+            for (const name of el.getAttributeNames()) {
+                if (!KEPT_ATTRIBUTES.has(name)) el.removeAttribute(name);
+            }
+        }
+        answerHtml = clone.innerHTML;
+    }
+    return {
+        question_url: questionLink ? questionLink.href : null,
+        question_text: questionTitle ? questionTitle.innerText.trim() : null,
+        answer_html: answerHtml
+    };
+})()
+""" % (json.dumps(QUESTION_LINK_SELECTOR), json.dumps(QUESTION_TITLE_SELECTOR), json.dumps(ANSWER_CONTENT_SELECTOR))
+
+LOG_PAGE_SCRIPT = """
+(() => {
+    const revisionLink = document.querySelector(%s);
+    const timestamp = document.querySelector(%s);
+    return {
+        revision_link: revisionLink ? revisionLink.href : null,
+        timestamp_raw: timestamp ? timestamp.innerText.trim() : null
+    };
+})()
+""" % (json.dumps(REVISION_LINK_SELECTOR), json.dumps(TIMESTAMP_SELECTOR))
+
 
 def check_quora_authentication(driver):
     """
@@ -45,3 +113,87 @@ def check_quora_authentication(driver):
     except Exception as e:
         logger.error(f"Error checking authentication status: {e}")
         return False
+
+
+def html_to_markdown(answer_html: str) -> str:
+    """Convert answer HTML to Markdown"""
+    # HTML2Text keeps its output buffer between handle() calls, so each answer needs a fresh instance
+    h = html2text.HTML2Text()
+    h.ignore_links = False
+    h.ignore_images = False
+    h.body_width = 0  # Don't wrap lines
+    return h.handle(answer_html).strip()
+
+
+def build_answer_update(answered_question_url: str, answer_data: dict) -> dict:
+    """Build the update_answer_data_batch() entry for an extracted answer"""
+    return {
+        'answered_question_url': answered_question_url,
+        'question_url': answer_data.get('question_url'),
+        'question_text': answer_data.get('question_text'),
+        'answer_content': answer_data.get('answer_content'),
+        'revision_link': answer_data.get('revision_link'),
+        'post_timestamp_raw': answer_data.get('post_timestamp_raw'),
+        'post_timestamp_parsed': answer_data.get('post_timestamp_parsed')
+    }
+
+
+def write_answer_updates(db_manager, pending_updates: list, record_failure, url_logger) -> int:
+    """Write buffered answer updates in one transaction, log each result and return the success count"""
+    if not pending_updates:
+        return 0
+
+    failed_urls = set(db_manager.update_answer_data_batch(pending_updates))
+    success_count = 0
+    for update in pending_updates:
+        url = update['answered_question_url']
+        if url in failed_urls:
+            record_failure(url)
+            url_logger.error(f"FAILED (DB Update): {url}")
+        else:
+            success_count += 1
+            url_logger.info(f"SUCCESS: {url}")
+    pending_updates.clear()
+    return success_count
+
+
+def evaluate_in_page(driver, expression: str) -> dict:
+    """Evaluate a JS expression via CDP Runtime.evaluate and return its JSON value"""
+    result = driver.execute_cdp_cmd('Runtime.evaluate', {
+        'expression': expression,
+        'returnByValue': True
+    })
+    return result.get('result', {}).get('value') or {}
+
+
+def wait_for_selector(driver, css_selector: str, timeout: int = PAGE_LOAD_TIMEOUT) -> bool:
+    """Wait until an element matching the selector is present, False on timeout"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def parse_quora_timestamp(timestamp_str: str):
+    """Convert a Quora timestamp string to an IST datetime, None if it can't be parsed"""
+    if not timestamp_str:
+        return None
+
+    # A regex match is much cheaper than datetime.strptime for this fixed format
+    match = QUORA_TIMESTAMP_PATTERN.fullmatch(timestamp_str.strip())
+    if not match or match.group(1) not in MONTH_NUMBERS:
+        return None
+
+    month, day, year, hour, minute, second, meridiem = match.groups()
+    hour = int(hour)
+    if not 1 <= hour <= 12:
+        return None
+    hour = hour % 12 + (12 if meridiem == 'PM' else 0)
+
+    try:
+        return IST.localize(datetime(int(year), MONTH_NUMBERS[month], int(day), hour, int(minute), int(second)))
+    except ValueError:
+        return None
@@ -1,12 +1,30 @@
 import os
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
+import threading
 from typing import Optional
 import logging
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Connection pools shared by every DatabaseManager in this process, keyed by database URL,
+# so short-lived managers (e.g. database_context per batch) reuse open connections
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+POOL_MAX_CONNECTIONS = int(os.getenv('DB_POOL_MAX_CONNECTIONS', '10'))
+
+
+def get_connection_pool(database_url: str) -> psycopg2.pool.ThreadedConnectionPool:
+    """Return the process-wide connection pool for a database URL, creating it on first use"""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(database_url)
+        if pool is None:
+            pool = psycopg2.pool.ThreadedConnectionPool(1, POOL_MAX_CONNECTIONS, dsn=database_url)
+            _POOLS[database_url] = pool
+        return pool
+
 
 class DatabaseManager:
     """Manages PostgreSQL database connections and operations"""
@@ -20,9 +38,9 @@ class DatabaseManager:
         self.cursor = None
     
     def connect(self):
-        """Establish database connection"""
+        """Check out a database connection from the pool"""
         try:
-            self.connection = psycopg2.connect(self.database_url)
+            self.connection = get_connection_pool(self.database_url).getconn()
             self.cursor = self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             logger.info("Connected to PostgreSQL database")
         except Exception as e:
@@ -30,15 +48,21 @@ class DatabaseManager:
             raise
     
     def disconnect(self):
-        """Close database connection"""
+        """Return database connection to the pool"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.connection:
-            self.connection.close()
+            # Discard any uncommitted work so the next user gets a clean connection
+            self.connection.rollback()
+            get_connection_pool(self.database_url).putconn(self.connection)
+            self.connection = None
         logger.info("Disconnected from PostgreSQL database")
     
     def create_tables(self):
         """Create the quora_answers table if it doesn't exist"""
+        # The UNIQUE constraint already indexes answered_question_url, so no separate index is needed.
+        # The partial timestamp index serves the visualization API's range and ordered queries.
         create_table_sql = """
         CREATE TABLE IF NOT EXISTS quora_answers (
             id SERIAL PRIMARY KEY,
@@ -50,9 +74,9 @@ class DatabaseManager:
             post_timestamp_raw TEXT,
             post_timestamp_parsed TIMESTAMP WITH TIME ZONE NULL
         );
-        
-        CREATE INDEX IF NOT EXISTS idx_answered_question_url 
-        ON quora_answers(answered_question_url);
+        CREATE INDEX IF NOT EXISTS idx_post_timestamp_parsed
+        ON quora_answers(post_timestamp_parsed)
+        WHERE post_timestamp_parsed IS NOT NULL;
         """
         
         try:
@@ -82,8 +106,8 @@ class DatabaseManager:
             self.connection.rollback()
             raise
 
-    def insert_answer_links_batch(self, answer_urls: list) -> int:
-        """Insert multiple answer links in a single batch operation and return count of inserted"""
+    def insert_answer_links_batch(self, answer_urls) -> int:
+        """Insert multiple answer links (a list or set) in a single batch operation and return count of inserted"""
         if not answer_urls:
             return 0
 
@@ -94,12 +118,11 @@ class DatabaseManager:
         """
 
         try:
-            # Prepare data for batch insert
-            values = [(url,) for url in answer_urls]
-
-            # Use execute_values for efficient batch insert
+            # Use execute_values for efficient batch insert - a single page, so rowcount
+            # covers the whole batch rather than only the last page
             from psycopg2.extras import execute_values
-            execute_values(self.cursor, insert_sql, values, template=None, page_size=100)
+            execute_values(self.cursor, insert_sql, ((url,) for url in answer_urls),
+                           template=None, page_size=len(answer_urls))
 
             inserted_count = self.cursor.rowcount
             self.connection.commit()
@@ -140,13 +163,11 @@ class DatabaseManager:
         select_sql = "SELECT answered_question_url FROM quora_answers WHERE answered_question_url IS NOT NULL;"
         
         try:
-            self.cursor.execute(select_sql)
-            results = self.cursor.fetchall()
-            
-            url_set = set()
-            for row in results:
-                if row['answered_question_url']:
-                    url_set.add(row['answered_question_url'])
+            # Server-side cursor streams rows in chunks instead of loading the whole result at once
+            with self.connection.cursor(name='answer_urls') as stream_cursor:
+                stream_cursor.itersize = 10000
+                stream_cursor.execute(select_sql)
+                url_set = {row[0] for row in stream_cursor if row[0]}
             
             logger.info(f"Retrieved {len(url_set)} existing URLs from database")
             return url_set
@@ -247,6 +268,48 @@ class DatabaseManager:
             self.connection.rollback()
             return False
     
+    def update_answer_data_batch(self, entries: list) -> list:
+        """Update answer data for multiple entries in one transaction and return URLs that were not updated"""
+        if not entries:
+            return []
+
+        # None values keep the existing column value, matching update_answer_data
+        update_sql = """
+        UPDATE quora_answers
+        SET question_url = COALESCE(%s, question_url),
+            question_text = COALESCE(%s, question_text),
+            answer_content = COALESCE(%s, answer_content),
+            revision_link = COALESCE(%s, revision_link),
+            post_timestamp_raw = COALESCE(%s, post_timestamp_raw),
+            post_timestamp_parsed = COALESCE(%s, post_timestamp_parsed)
+        WHERE answered_question_url = %s
+        """
+
+        failed_urls = []
+        try:
+            for entry in entries:
+                self.cursor.execute(update_sql, (
+                    entry.get('question_url'),
+                    entry.get('question_text'),
+                    entry.get('answer_content'),
+                    entry.get('revision_link'),
+                    entry.get('post_timestamp_raw'),
+                    entry.get('post_timestamp_parsed'),
+                    entry['answered_question_url']
+                ))
+                if self.cursor.rowcount == 0:
+                    logger.warning(f"No row updated for URL: {entry['answered_question_url']}")
+                    failed_urls.append(entry['answered_question_url'])
+
+            self.connection.commit()
+            logger.debug(f"Batch updated {len(entries) - len(failed_urls)} entries")
+            return failed_urls
+
+        except Exception as e:
+            logger.error(f"Failed to batch update answer data: {e}")
+            self.connection.rollback()
+            return [entry['answered_question_url'] for entry in entries]
+    
     def get_incomplete_count(self) -> int:
         """Get count of entries that need processing"""
         count_sql = """
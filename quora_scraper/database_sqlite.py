@@ -45,6 +45,7 @@ class DatabaseManager:
     
     def create_tables(self):
         """Create the quora_answers table if it doesn't exist"""
+        # The UNIQUE constraint already indexes answered_question_url, so no separate index is needed
         create_table_sql = """
         CREATE TABLE IF NOT EXISTS quora_answers (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -57,10 +58,11 @@ class DatabaseManager:
             post_timestamp_parsed TEXT
         )
         """
-        
+        # Serves the visualization API's date-range and ordered timestamp queries
         create_index_sql = """
-        CREATE INDEX IF NOT EXISTS idx_answered_question_url 
-        ON quora_answers(answered_question_url)
+        CREATE INDEX IF NOT EXISTS idx_post_timestamp_parsed
+        ON quora_answers(post_timestamp_parsed)
+        WHERE post_timestamp_parsed IS NOT NULL
         """
         
         try:
@@ -89,8 +91,8 @@ class DatabaseManager:
             self.connection.rollback()
             raise
 
-    def insert_answer_links_batch(self, answer_urls: list) -> int:
-        """Insert multiple answer links in a single batch operation and return count of inserted"""
+    def insert_answer_links_batch(self, answer_urls) -> int:
+        """Insert multiple answer links (a list or set) in a single batch operation and return count of inserted"""
         if not answer_urls:
             return 0
 
@@ -100,8 +102,7 @@ class DatabaseManager:
         """
 
         try:
-            values = [(url,) for url in answer_urls]
-            self.cursor.executemany(insert_sql, values)
+            self.cursor.executemany(insert_sql, ((url,) for url in answer_urls))
             inserted_count = self.cursor.rowcount
             self.connection.commit()
 
@@ -141,13 +142,13 @@ class DatabaseManager:
         select_sql = "SELECT answered_question_url FROM quora_answers WHERE answered_question_url IS NOT NULL"
         
         try:
-            self.cursor.execute(select_sql)
-            results = self.cursor.fetchall()
-            
-            url_set = set()
-            for row in results:
-                if row['answered_question_url']:
-                    url_set.add(row['answered_question_url'])
+            # Plain tuple rows skip dict_factory; iterating the cursor streams rows
+            # into the set instead of materializing them with fetchall()
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            cursor.execute(select_sql)
+            url_set = {row[0] for row in cursor if row[0]}
+            cursor.close()
             
             logger.info(f"Retrieved {len(url_set)} existing URLs from database")
             return url_set
@@ -249,6 +250,48 @@ class DatabaseManager:
             self.connection.rollback()
             return False
     
+    def update_answer_data_batch(self, entries: list) -> list:
+        """Update answer data for multiple entries in one transaction and return URLs that were not updated"""
+        if not entries:
+            return []
+
+        # None values keep the existing column value, matching update_answer_data
+        update_sql = """
+        UPDATE quora_answers
+        SET question_url = COALESCE(?, question_url),
+            question_text = COALESCE(?, question_text),
+            answer_content = COALESCE(?, answer_content),
+            revision_link = COALESCE(?, revision_link),
+            post_timestamp_raw = COALESCE(?, post_timestamp_raw),
+            post_timestamp_parsed = COALESCE(?, post_timestamp_parsed)
+        WHERE answered_question_url = ?
+        """
+
+        failed_urls = []
+        try:
+            for entry in entries:
+                self.cursor.execute(update_sql, (
+                    entry.get('question_url'),
+                    entry.get('question_text'),
+                    entry.get('answer_content'),
+                    entry.get('revision_link'),
+                    entry.get('post_timestamp_raw'),
+                    str(entry['post_timestamp_parsed']) if entry.get('post_timestamp_parsed') else None,
+                    entry['answered_question_url']
+                ))
+                if self.cursor.rowcount == 0:
+                    logger.warning(f"No row updated for URL: {entry['answered_question_url']}")
+                    failed_urls.append(entry['answered_question_url'])
+
+            self.connection.commit()
+            logger.debug(f"Batch updated {len(entries) - len(failed_urls)} entries")
+            return failed_urls
+
+        except Exception as e:
+            logger.error(f"Failed to batch update answer data: {e}")
+            self.connection.rollback()
+            return [entry['answered_question_url'] for entry in entries]
+    
     def get_incomplete_count(self) -> int:
         """Get count of entries that need processing"""
         count_sql = """
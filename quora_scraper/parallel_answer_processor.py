@@ -1,35 +1,45 @@
 #!/usr/bin/env python3
 """
-Parallel Quora Answer Processor - Process answers in parallel using multiple Chrome instances
+Parallel Quora Answer Processor - Process answers in parallel, one tab of a shared Chrome instance per worker
 """
 
 import os
 import sys
 import time
+import queue
 import logging
+import threading
 import multiprocessing as mp
-from multiprocessing import Pool, Manager, Queue
+from multiprocessing import Queue
+from multiprocessing.connection import wait
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-import pytz
-from selenium.webdriver.common.by import By
-import html2text
+from typing import List, Dict, Optional
 import requests
 
 from .database_sqlite import DatabaseManager
-from .chrome_driver_manager import ChromeDriverManager
-from .common import check_quora_authentication
+from .chrome_driver_manager import (
+    ChromeDriverManager, CHROME_PERFORMANCE_FLAGS, CHROME_PROFILE_DIR, cdp_session, find_chrome_path, wait_for_debugging_endpoint
+)
+from .common import (
+    check_quora_authentication, html_to_markdown, evaluate_in_page, parse_quora_timestamp, wait_for_selector,
+    build_answer_update, write_answer_updates, QUESTION_TITLE_SELECTOR, REVISION_LINK_SELECTOR, ANSWER_PAGE_SCRIPT,
+    LOG_PAGE_SCRIPT, DB_BATCH_SIZE
+)
 
 # Configure main logger only
 logger = logging.getLogger(__name__)
 
+# Database updates are committed in batches of DB_BATCH_SIZE or every DB_FLUSH_INTERVAL seconds
+DB_FLUSH_INTERVAL = 5
+
 
 class ParallelChromeManager(ChromeDriverManager):
-    """Chrome manager for parallel processing with specific port"""
+    """Chrome manager for parallel processing with specific port and tab"""
 
-    def __init__(self, debug_port: int = 9223):
+    def __init__(self, debug_port: int = 9223, target_id: Optional[str] = None):
         super().__init__()
         self.debug_port = debug_port
+        self.target_id = target_id
         self.driver = None
         self.authenticated = False
 
@@ -41,7 +51,7 @@ class ParallelChromeManager(ChromeDriverManager):
             logger.info(f'Worker connecting to Chrome on port {self.debug_port}...')
 
             # Check if Chrome is running on this port
-            response = requests.get(f'{cdp_url}/json', timeout=2)
+            response = cdp_session.get(f'{cdp_url}/json', timeout=2)
             if response.status_code == 200:
                 tabs_info = response.json()
                 logger.info(f"Worker found Chrome with {len(tabs_info)} tabs on port {self.debug_port}")
@@ -60,9 +70,18 @@ class ParallelChromeManager(ChromeDriverManager):
 
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
 
+                # Workers share one Chrome - switch to this worker's own tab
+                # (ChromeDriver window handles are CDP target IDs)
+                if self.target_id:
+                    self.driver.switch_to.window(self.target_id)
+
                 # Apply stealth mode
                 self.apply_stealth_mode()
 
+                # Extraction only needs the DOM, so skip downloading media in worker tabs
+                if self.target_id:
+                    self.block_heavy_resources()
+
                 # Check authentication
                 current_url = self.driver.current_url
                 logger.info(f"Worker connected to Chrome on port {self.debug_port}")
@@ -78,47 +97,27 @@ class ParallelChromeManager(ChromeDriverManager):
     def start_chrome_with_debugging(self):
         """Start Chrome with specific debug port"""
         try:
-            import platform
             import subprocess
 
-            is_mac_arm = platform.system() == 'Darwin' and platform.machine() == 'arm64'
-
-            if is_mac_arm:
-                chrome_path = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-            else:
-                chrome_path = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-                if not os.path.exists(chrome_path):
-                    possible_paths = [
-                        '/usr/bin/google-chrome',
-                        '/usr/bin/chromium-browser',
-                        'google-chrome'
-                    ]
-                    for path in possible_paths:
-                        if os.path.exists(path) or subprocess.run(['which', path],
-                                                                capture_output=True).returncode == 0:
-                            chrome_path = path
-                            break
+            chrome_path = find_chrome_path()
 
             # Start Chrome with specific port
             chrome_cmd = [
                 chrome_path,
                 f'--remote-debugging-port={self.debug_port}',
-                f'--user-data-dir=/tmp/chrome_debug_profile_{self.debug_port}',
+                f'--user-data-dir={CHROME_PROFILE_DIR}_{self.debug_port}',
                 '--no-first-run',
                 '--no-default-browser-check',
                 '--disable-default-apps',
-                '--new-window'
+                '--new-window',
+                *CHROME_PERFORMANCE_FLAGS
             ]
 
             logger.info(f"Starting Chrome on port {self.debug_port}...")
             subprocess.Popen(chrome_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-            # Wait for Chrome to start
-            time.sleep(3)
-
-            # Verify Chrome started
-            response = requests.get(f'http://localhost:{self.debug_port}/json', timeout=5)
-            if response.status_code == 200:
+            # Wait until Chrome accepts debugging connections
+            if wait_for_debugging_endpoint(self.debug_port):
                 logger.info(f"Chrome started successfully on port {self.debug_port}")
                 return True
             else:
@@ -153,22 +152,95 @@ def setup_worker_logging(worker_id: int, log_dir: str = "logs"):
     return worker_logger, log_file
 
 
-def worker_process_answers(args: Tuple[int, List[Dict], int, Queue, Queue, str]):
+class AnswerWriter(threading.Thread):
+    """Background thread that writes a worker's extracted answers to the database in batches"""
+
+    def __init__(self, worker_id: int, success_counts, record_failure, worker_logger):
+        super().__init__(daemon=True)
+        self.worker_id = worker_id
+        self.success_counts = success_counts
+        self.record_failure = record_failure
+        self.worker_logger = worker_logger
+        self.updates = queue.Queue()
+        self.success_count = 0
+
+    def put(self, update: Dict):
+        """Queue an answer update for writing"""
+        self.updates.put(update)
+
+    def close(self):
+        """Flush remaining updates and wait for the thread to finish"""
+        self.updates.put(None)
+        self.join()
+
+    def run(self):
+        # SQLite connections can only be used by the thread that created them
+        db_manager = DatabaseManager()
+        try:
+            db_manager.connect()
+        except Exception as e:
+            self.worker_logger.error(f"Worker {self.worker_id}: Writer could not connect to the database: {e}")
+            # Keep consuming so extracted answers are recorded as failures rather than dropped
+            for update in iter(self.updates.get, None):
+                self.record_failure(update['answered_question_url'])
+                self.worker_logger.error(f"FAILED (DB Connect): {update['answered_question_url']}")
+            return
+
+        pending_updates = []
+        last_flush = time.time()
+        try:
+            while True:
+                # Wake up at least when the flush interval elapses
+                timeout = max(0, DB_FLUSH_INTERVAL - (time.time() - last_flush))
+                try:
+                    update = self.updates.get(timeout=timeout)
+                    if update is None:
+                        break
+                    pending_updates.append(update)
+                except queue.Empty:
+                    pass
+
+                if len(pending_updates) >= DB_BATCH_SIZE or time.time() - last_flush >= DB_FLUSH_INTERVAL:
+                    self.flush(db_manager, pending_updates)
+                    last_flush = time.time()
+        finally:
+            self.flush(db_manager, pending_updates)
+            db_manager.disconnect()
+
+    def flush(self, db_manager: DatabaseManager, pending_updates: List[Dict]):
+        """Write buffered updates in one transaction and publish the new success count"""
+        if not pending_updates:
+            return
+
+        self.success_count += write_answer_updates(db_manager, pending_updates, self.record_failure, self.worker_logger)
+        self.success_counts[self.worker_id] = self.success_count
+
+
+def failed_urls_path(log_dir: str, worker_id: int) -> str:
+    """Path of the file a worker appends its failed URLs to"""
+    return f"{log_dir}/failed_{worker_id}.txt"
+
+
+def worker_process_answers(worker_id: int, task_queue: Queue, processed_counts, success_counts,
+                           debug_port: int, target_id: Optional[str], log_dir: str):
     """
-    Worker function to process a chunk of answers
+    Worker loop that pulls answers from the shared task queue until it receives None
 
     Args:
-        args: Tuple of (worker_id, url_chunks, debug_port, progress_queue, failed_queue, log_dir)
+        worker_id: Index of this worker's slot in the shared counter arrays
+        task_queue: Queue of database entries shared by all workers
+        processed_counts, success_counts: Shared per-worker progress counters
+        debug_port: Chrome remote debugging port shared by all workers
+        target_id: CDP target ID of the tab this worker drives
+        log_dir: Directory for the worker log and failed URL files
     """
-    worker_id, url_chunk, debug_port, progress_queue, failed_queue, log_dir = args
-
     # Setup file-only logging for this worker
     worker_logger, log_file = setup_worker_logging(worker_id, log_dir)
-    worker_logger.info(f"Worker {worker_id} started with {len(url_chunk)} URLs on port {debug_port}")
+    worker_logger.info(f"Worker {worker_id} started on port {debug_port}")
     worker_logger.info(f"Log file: {log_file}")
 
     # Create Chrome manager for this worker
-    chrome_manager = ParallelChromeManager(debug_port=debug_port)
+    chrome_manager = ParallelChromeManager(debug_port=debug_port, target_id=target_id)
 
     # Setup Chrome driver
     if not chrome_manager.setup_driver():
@@ -181,16 +253,24 @@ def worker_process_answers(args: Tuple[int, List[Dict], int, Queue, Queue, str])
         chrome_manager.cleanup()
         return
 
-    # Create database connection for this worker
-    db_manager = DatabaseManager()
-    db_manager.connect()
+    # Failed URLs go to a per-worker file that the coordinator reads once all workers finish
+    failed_file = open(failed_urls_path(log_dir, worker_id), "a", buffering=1)
+    failed_file_lock = threading.Lock()
+
+    def record_failure(url: str):
+        """Append a failed URL to this worker's file (called from both threads)"""
+        with failed_file_lock:
+            failed_file.write(url + "\n")
+
+    # Database writes run on a background thread so they overlap with the next page load
+    writer = AnswerWriter(worker_id, success_counts, record_failure, worker_logger)
+    writer.start()
 
     # Process URLs
     processed_count = 0
-    success_count = 0
 
     try:
-        for entry in url_chunk:
+        for entry in iter(task_queue.get, None):
             answered_question_url = entry['answered_question_url']
             entry_id = entry['id']
 
@@ -201,42 +281,19 @@ def worker_process_answers(args: Tuple[int, List[Dict], int, Queue, Queue, str])
                 if answer_data:
                     # Check critical fields
                     if answer_data.get('question_text') and answer_data.get('answer_content'):
-                        # Update database
-                        success = db_manager.update_answer_data(
-                            answered_question_url=answered_question_url,
-                            question_url=answer_data.get('question_url'),
-                            question_text=answer_data.get('question_text'),
-                            answer_content=answer_data.get('answer_content'),
-                            revision_link=answer_data.get('revision_link'),
-                            post_timestamp_raw=answer_data.get('post_timestamp_raw'),
-                            post_timestamp_parsed=answer_data.get('post_timestamp_parsed')
-                        )
-
-                        if success:
-                            success_count += 1
-                            worker_logger.info(f"SUCCESS: {answered_question_url}")
-                        else:
-                            failed_queue.put(answered_question_url)
-                            worker_logger.error(f"FAILED (DB Update): {answered_question_url}")
+                        # Hand the update to the writer thread
+                        writer.put(build_answer_update(answered_question_url, answer_data))
                     else:
-                        failed_queue.put(answered_question_url)
+                        record_failure(answered_question_url)
                         worker_logger.error(f"FAILED (Missing fields): {answered_question_url}")
                 else:
-                    failed_queue.put(answered_question_url)
+                    record_failure(answered_question_url)
                     worker_logger.error(f"FAILED (Extraction): {answered_question_url}")
 
                 processed_count += 1
 
-                # Send progress update
-                progress_queue.put({
-                    'worker_id': worker_id,
-                    'processed': processed_count,
-                    'success': success_count,
-                    'total': len(url_chunk)
-                })
-
-                # Respectful delay
-                time.sleep(0.5)  # Shorter delay since we have multiple workers
+                # Publish progress through the shared counters
+                processed_counts[worker_id] = processed_count
 
             except Exception as e:
                 # Check for session errors and attempt recovery
@@ -254,15 +311,17 @@ def worker_process_answers(args: Tuple[int, List[Dict], int, Queue, Queue, str])
                 else:
                     worker_logger.error(f"Error processing {answered_question_url}: {e}")
 
-                failed_queue.put(answered_question_url)
+                record_failure(answered_question_url)
                 processed_count += 1
+                processed_counts[worker_id] = processed_count
                 continue
 
     finally:
-        # Cleanup
-        db_manager.disconnect()
+        # Let the writer flush remaining updates before cleanup
+        writer.close()
+        failed_file.close()
         chrome_manager.cleanup()
-        worker_logger.info(f"Worker completed: {success_count}/{processed_count} successful")
+        worker_logger.info(f"Worker completed: {writer.success_count}/{processed_count} successful")
         worker_logger.info(f"Worker {worker_id} shutting down")
 
 
@@ -272,79 +331,40 @@ def extract_answer_data_worker(chrome_manager: ParallelChromeManager, answered_q
         # Clean the URL by removing ?no_redirect=1 if present
         cleaned_url = answered_question_url.split('?no_redirect=1')[0]
 
+        driver = chrome_manager.get_driver()
+
         # Navigate to the answer page
-        chrome_manager.get_driver().get(answered_question_url)
-        time.sleep(3)  # Wait for page to load
+        driver.get(answered_question_url)
+        if not wait_for_selector(driver, QUESTION_TITLE_SELECTOR):
+            logger.warning(f"Timed out waiting for answer page: {answered_question_url}")
 
         answer_data = {}
         answer_data['answered_question_url'] = cleaned_url
         answered_question_url = cleaned_url
 
-        # Extract question URL
-        try:
-            question_url_element = chrome_manager.get_driver().find_element(
-                By.CSS_SELECTOR, "a.puppeteer_test_link:has(.puppeteer_test_question_title)"
-            )
-            answer_data['question_url'] = question_url_element.get_attribute('href')
-        except Exception:
-            answer_data['question_url'] = None
-
-        # Extract question text
-        try:
-            question_text_element = chrome_manager.get_driver().find_element(
-                By.CSS_SELECTOR, ".puppeteer_test_question_title span"
-            )
-            answer_data['question_text'] = question_text_element.text.strip()
-        except Exception:
-            answer_data['question_text'] = None
+        # Extract question URL, question text and answer HTML in a single round-trip
+        page_data = evaluate_in_page(driver, ANSWER_PAGE_SCRIPT)
+        answer_data['question_url'] = page_data.get('question_url')
+        answer_data['question_text'] = page_data.get('question_text')
 
-        # Extract answer content
-        try:
-            answer_content_element = chrome_manager.get_driver().find_element(
-                By.CSS_SELECTOR, "div.q-text[style*='max-width: 100%'] span.q-box.qu-userSelect--text"
-            )
-            answer_html = answer_content_element.get_attribute('innerHTML')
-
-            h = html2text.HTML2Text()
-            h.ignore_links = False
-            h.ignore_images = False
-            h.body_width = 0
-            answer_markdown = h.handle(answer_html)
-
-            answer_data['answer_content'] = answer_markdown.strip()
-        except Exception:
+        answer_html = page_data.get('answer_html')
+        if answer_html:
+            answer_data['answer_content'] = html_to_markdown(answer_html)
+        else:
             answer_data['answer_content'] = None
 
         # Extract revision data from log page
         log_url = f"{answered_question_url}/log"
         try:
-            chrome_manager.get_driver().get(log_url)
-            time.sleep(2)
+            driver.get(log_url)
+            wait_for_selector(driver, REVISION_LINK_SELECTOR)
 
-            # Extract revision link
-            try:
-                revision_link_element = chrome_manager.get_driver().find_element(
-                    By.CSS_SELECTOR, "a.puppeteer_test_link[href*='/log/revision/']"
-                )
-                answer_data['revision_link'] = revision_link_element.get_attribute('href')
-            except Exception:
-                answer_data['revision_link'] = None
-
-            # Extract timestamp
-            try:
-                timestamp_element = chrome_manager.get_driver().find_element(
-                    By.CSS_SELECTOR, "span.c1h7helg.c8970ew:last-child"
-                )
-                timestamp_raw = timestamp_element.text.strip()
-                answer_data['post_timestamp_raw'] = timestamp_raw
+            log_data = evaluate_in_page(driver, LOG_PAGE_SCRIPT)
+            answer_data['revision_link'] = log_data.get('revision_link')
 
-                # Parse timestamp
-                parsed_timestamp = parse_quora_timestamp(timestamp_raw)
-                answer_data['post_timestamp_parsed'] = parsed_timestamp
-
-            except Exception:
-                answer_data['post_timestamp_raw'] = None
-                answer_data['post_timestamp_parsed'] = None
+            timestamp_raw = log_data.get('timestamp_raw')
+            answer_data['post_timestamp_raw'] = timestamp_raw
+            answer_data['post_timestamp_parsed'] = parse_quora_timestamp(timestamp_raw)
 
         except Exception:
             answer_data['revision_link'] = None
@@ -362,26 +382,12 @@ def extract_answer_data_worker(chrome_manager: ParallelChromeManager, answered_q
         return None
 
 
-def parse_quora_timestamp(timestamp_str: str):
-    """Parse Quora timestamp string"""
-    if not timestamp_str:
-        return None
-
-    try:
-        dt = datetime.strptime(timestamp_str, "%B %d, %Y at %I:%M:%S %p")
-        ist = pytz.timezone('Asia/Kolkata')
-        dt_with_tz = ist.localize(dt)
-        return dt_with_tz
-    except ValueError:
-        return None
-
-
 class ParallelAnswerProcessor:
     """Main class for parallel answer processing"""
 
     def __init__(self, num_workers: int = 3):
         self.num_workers = min(num_workers, 5)  # Max 5 workers
-        self.base_debug_port = 9223
+        self.debug_port = 9223
         self.failed_urls = []
         self.setup_logging()
 
@@ -410,56 +416,48 @@ class ParallelAnswerProcessor:
         file_handler.setFormatter(formatter)
         self.coordinator_logger.addHandler(file_handler)
 
-    def ensure_chrome_instances(self):
-        """Ensure Chrome instances are running on required ports"""
-        ports_needed = []
-
-        for i in range(self.num_workers):
-            port = self.base_debug_port + i
-            try:
-                # Check if Chrome is already running on this port
-                response = requests.get(f'http://localhost:{port}/json', timeout=1)
-                if response.status_code == 200:
-                    self.coordinator_logger.info(f"Chrome already running on port {port}")
-                else:
-                    ports_needed.append(port)
-            except:
-                ports_needed.append(port)
-
-        # Start Chrome instances for missing ports
-        for port in ports_needed:
-            self.coordinator_logger.info(f"Starting Chrome on port {port}...")
-            chrome_manager = ParallelChromeManager(debug_port=port)
-            if chrome_manager.start_chrome_with_debugging():
-                self.coordinator_logger.info(f"Successfully started Chrome on port {port}")
-            else:
-                self.coordinator_logger.error(f"Failed to start Chrome on port {port}")
-
-        # Give Chrome instances time to fully start
-        if ports_needed:
-            time.sleep(5)
-        else:
-            self.coordinator_logger.info("All required Chrome instances are already running")
-
-    def divide_work(self, entries: List[Dict]) -> List[List[Dict]]:
-        """Divide entries into chunks for workers"""
-        chunk_size = len(entries) // self.num_workers
-        remainder = len(entries) % self.num_workers
-
-        chunks = []
-        start = 0
-
-        for i in range(self.num_workers):
-            # Add 1 to chunk size for first 'remainder' workers to handle the remainder
-            current_chunk_size = chunk_size + (1 if i < remainder else 0)
-            end = start + current_chunk_size
+    def ensure_chrome_instance(self) -> bool:
+        """Ensure the Chrome instance shared by all workers is running"""
+        try:
+            # Check if Chrome is already running on this port
+            response = cdp_session.get(f'http://localhost:{self.debug_port}/json', timeout=1)
+            if response.status_code == 200:
+                self.coordinator_logger.info(f"Chrome already running on port {self.debug_port}")
+                return True
+        except requests.RequestException:
+            pass
 
-            if current_chunk_size > 0:
-                chunks.append(entries[start:end])
+        self.coordinator_logger.info(f"Starting Chrome on port {self.debug_port}...")
+        chrome_manager = ParallelChromeManager(debug_port=self.debug_port)
+        if chrome_manager.start_chrome_with_debugging():
+            self.coordinator_logger.info(f"Successfully started Chrome on port {self.debug_port}")
+            return True
 
-            start = end
+        self.coordinator_logger.error(f"Failed to start Chrome on port {self.debug_port}")
+        return False
 
-        return chunks
+    def open_worker_tabs(self) -> List[str]:
+        """Open one tab per worker in the shared Chrome and return their CDP target IDs"""
+        target_ids = []
+        try:
+            for i in range(self.num_workers):
+                response = cdp_session.put(f'http://localhost:{self.debug_port}/json/new?about:blank', timeout=5)
+                response.raise_for_status()
+                target_ids.append(response.json()['id'])
+        except Exception:
+            # Don't leave the tabs opened so far behind
+            self.close_worker_tabs(target_ids)
+            raise
+        self.coordinator_logger.info(f"Opened {len(target_ids)} worker tabs on port {self.debug_port}")
+        return target_ids
+
+    def close_worker_tabs(self, target_ids: List[str]):
+        """Close the tabs opened for workers"""
+        for target_id in target_ids:
+            try:
+                cdp_session.get(f'http://localhost:{self.debug_port}/json/close/{target_id}', timeout=2)
+            except requests.RequestException as e:
+                self.coordinator_logger.warning(f"Could not close tab {target_id}: {e}")
 
     def process_entries_parallel(self):
         """Main method to process entries in parallel"""
@@ -468,8 +466,10 @@ class ParallelAnswerProcessor:
         print(f"{'='*70}")
         self.coordinator_logger.info(f"Starting parallel processing with {self.num_workers} workers")
 
-        # Ensure Chrome instances are running
-        self.ensure_chrome_instances()
+        # Ensure the shared Chrome instance is running
+        if not self.ensure_chrome_instance():
+            print(f"Could not start Chrome on port {self.debug_port}")
+            return False
 
         # Get incomplete entries from database
         db_manager = DatabaseManager()
@@ -493,35 +493,53 @@ class ParallelAnswerProcessor:
             self.coordinator_logger.info(f"Found {total_entries} incomplete entries")
             self.coordinator_logger.info(f"Using {self.num_workers} workers")
 
-            # Divide work among workers
-            chunks = self.divide_work(incomplete_entries)
-
-            # Create manager for shared data
-            manager = Manager()
-            progress_queue = manager.Queue()
-            failed_queue = manager.Queue()
-
-            # Prepare worker arguments
-            worker_args = []
-            for i, chunk in enumerate(chunks):
-                if chunk:  # Only add workers with actual work
-                    port = self.base_debug_port + i
-                    worker_args.append((i, chunk, port, progress_queue, failed_queue, self.log_dir))
-
-            # Start worker pool
-            with Pool(processes=len(worker_args)) as pool:
-                # Start workers
-                results = pool.map_async(worker_process_answers, worker_args)
+            # Queue every entry followed by one stop sentinel per worker, so
+            # workers keep pulling URLs until the queue is exhausted
+            task_queue = mp.Queue()
+            for entry in incomplete_entries:
+                task_queue.put(entry)
+            for _ in range(self.num_workers):
+                task_queue.put(None)
+            # Don't block interpreter exit flushing entries nobody will read
+            # (workers that exited early, or an interrupted run)
+            task_queue.cancel_join_thread()
+
+            # Create shared progress counters (one slot per worker)
+            processed_counts = mp.Array('q', self.num_workers, lock=False)
+            success_counts = mp.Array('q', self.num_workers, lock=False)
+
+            # Start worker processes, each driving its own tab of the shared Chrome
+            target_ids = self.open_worker_tabs()
+            workers = []
+            try:
+                for i in range(self.num_workers):
+                    process = mp.Process(
+                        target=worker_process_answers,
+                        args=(i, task_queue, processed_counts, success_counts,
+                              self.debug_port, target_ids[i], self.log_dir)
+                    )
+                    process.start()
+                    workers.append(process)
 
                 # Monitor progress
-                self.monitor_progress(progress_queue, failed_queue, total_entries, len(worker_args))
-
-                # Wait for completion
-                results.wait()
-
-            # Collect failed URLs
-            while not failed_queue.empty():
-                self.failed_urls.append(failed_queue.get())
+                self.monitor_progress(processed_counts, success_counts, total_entries, workers)
+
+                for process in workers:
+                    process.join()
+            finally:
+                # On an interrupted or failed run, stop workers still driving their tabs
+                for process in workers:
+                    if process.is_alive():
+                        process.terminate()
+                        process.join()
+                self.close_worker_tabs(target_ids)
+
+            # Collect failed URLs from the per-worker files
+            for i in range(self.num_workers):
+                path = failed_urls_path(self.log_dir, i)
+                if os.path.exists(path):
+                    with open(path) as f:
+                        self.failed_urls.extend(line.strip() for line in f if line.strip())
 
             # Final summary
             print(f"\n{'='*70}")
@@ -531,7 +549,7 @@ class ParallelAnswerProcessor:
             print(f"Failed: {len(self.failed_urls)}")
             print(f"\nLogs saved to: {self.log_dir}/")
             print(f"  Coordinator log: coordinator.log")
-            for i in range(len(worker_args)):
+            for i in range(self.num_workers):
                 print(f"  Worker {i} log: worker_{i}_*.log")
 
             self.coordinator_logger.info("="*80)
@@ -555,53 +573,35 @@ class ParallelAnswerProcessor:
         finally:
             db_manager.disconnect()
 
-    def monitor_progress(self, progress_queue: Queue, failed_queue: Queue, total: int, num_workers: int):
+    def monitor_progress(self, processed_counts, success_counts, total: int, workers: List[mp.Process]):
         """Monitor and display progress from all workers"""
-        worker_progress = {i: {'processed': 0, 'success': 0} for i in range(num_workers)}
-
         start_time = time.time()
-        last_update = 0
 
         while True:
-            # Check for progress updates
-            while not progress_queue.empty():
-                try:
-                    update = progress_queue.get_nowait()
-                    worker_id = update['worker_id']
-                    worker_progress[worker_id] = {
-                        'processed': update['processed'],
-                        'success': update['success']
-                    }
-                except:
-                    break
-
-            # Calculate totals
-            total_processed = sum(w['processed'] for w in worker_progress.values())
-            total_success = sum(w['success'] for w in worker_progress.values())
-
-            # Update display every second
-            current_time = time.time()
-            if current_time - last_update >= 1:
-                elapsed = int(current_time - start_time)
-                progress_pct = (total_processed / total * 100) if total > 0 else 0
-
-                # Calculate rate
-                rate = total_processed / elapsed if elapsed > 0 else 0
-                eta = int((total - total_processed) / rate) if rate > 0 else 0
-
-                # Format time remaining
-                eta_min = eta // 60
-                eta_sec = eta % 60
-                eta_str = f"{eta_min}m {eta_sec}s" if eta_min > 0 else f"{eta_sec}s"
-
-                status = (f"\r⚡ Progress: {total_processed}/{total} ({progress_pct:.1f}%) | "
-                         f"✓ Success: {total_success} | "
-                         f"⚡ Rate: {rate:.1f}/s | "
-                         f"⏱ ETA: {eta_str} | "
-                         f"👥 Workers: {num_workers}")
-
-                print(status, end="", flush=True)
-                last_update = current_time
+            # Calculate totals from the shared per-worker counters
+            total_processed = sum(processed_counts)
+            total_success = sum(success_counts)
+
+            # Update display
+            elapsed = int(time.time() - start_time)
+            progress_pct = (total_processed / total * 100) if total > 0 else 0
+
+            # Calculate rate
+            rate = total_processed / elapsed if elapsed > 0 else 0
+            eta = int((total - total_processed) / rate) if rate > 0 else 0
+
+            # Format time remaining
+            eta_min = eta // 60
+            eta_sec = eta % 60
+            eta_str = f"{eta_min}m {eta_sec}s" if eta_min > 0 else f"{eta_sec}s"
+
+            status = (f"\r⚡ Progress: {total_processed}/{total} ({progress_pct:.1f}%) | "
+                     f"✓ Success: {total_success} | "
+                     f"⚡ Rate: {rate:.1f}/s | "
+                     f"⏱ ETA: {eta_str} | "
+                     f"👥 Workers: {sum(process.is_alive() for process in workers)}")
+
+            print(status, end="", flush=True)
 
             # Check if all done
             if total_processed >= total:
@@ -609,7 +609,14 @@ class ParallelAnswerProcessor:
                 self.coordinator_logger.info(f"All {total} entries processed")
                 break
 
-            time.sleep(0.1)  # Small delay to prevent CPU spinning
+            # Stop waiting if every worker has exited early
+            if not any(process.is_alive() for process in workers):
+                print()
+                self.coordinator_logger.error(f"All workers exited with {total - total_processed} entries unprocessed")
+                break
+
+            # Sleep until a worker exits or the next once-a-second redraw is due
+            wait([process.sentinel for process in workers if process.is_alive()], timeout=1)
 
 
 def run_parallel_processor(num_workers: int = 3):
@@ -4,6 +4,9 @@ from .items import QuoraAnswerItem
 
 logger = logging.getLogger(__name__)
 
+# Number of scraped links buffered before they are written in one batch
+PIPELINE_BATCH_SIZE = 500
+
 
 class PostgreSQLPipeline:
     """Pipeline to store scraped items in PostgreSQL database"""
@@ -11,6 +14,7 @@ class PostgreSQLPipeline:
     def __init__(self):
         self.db_manager = None
         self.items_processed = 0
+        self.pending_urls = []
         
     def open_spider(self, spider):
         """Initialize database connection when spider opens"""
@@ -24,8 +28,9 @@ class PostgreSQLPipeline:
             raise
     
     def close_spider(self, spider):
-        """Close database connection when spider closes"""
+        """Flush buffered links and close database connection when spider closes"""
         if self.db_manager:
+            self.flush_pending_urls()
             self.db_manager.disconnect()
         logger.info(f"PostgreSQL pipeline closed. Total items processed: {self.items_processed}")
     
@@ -39,22 +44,28 @@ class PostgreSQLPipeline:
             answered_question_url = item.get('answered_question_url')
             
             if answered_question_url:
-                # Check if the answer already exists
-                if not self.db_manager.check_answer_exists(answered_question_url):
-                    item_id = self.db_manager.insert_answer_link(answered_question_url)
-                    item['id'] = item_id
-                    self.items_processed += 1
-                    
-                    # Log progress every 100 answers
-                    if self.items_processed % 100 == 0:
-                        total_count = self.db_manager.get_answer_count()
-                        logger.info(f"Progress: {self.items_processed} new answers processed. Total in DB: {total_count}")
-                else:
-                    logger.debug(f"Answer already exists: {answered_question_url}")
+                self.pending_urls.append(answered_question_url)
+                if len(self.pending_urls) >= PIPELINE_BATCH_SIZE:
+                    self.flush_pending_urls()
             
             return item
             
         except Exception as e:
             logger.error(f"Error processing item: {e}")
             logger.error(f"Item data: {dict(item)}")
-            return item 
\ No newline at end of file
+            return item
+
+    def flush_pending_urls(self):
+        """Insert buffered answer links in one batch, skipping ones already stored"""
+        if not self.pending_urls:
+            return
+
+        try:
+            inserted_count = self.db_manager.insert_answer_links_batch(self.pending_urls)
+            self.items_processed += inserted_count
+            total_count = self.db_manager.get_answer_count()
+            logger.info(f"Progress: {self.items_processed} new answers processed. Total in DB: {total_count}")
+        except Exception as e:
+            logger.error(f"Error flushing {len(self.pending_urls)} buffered answer links: {e}")
+        finally:
+            self.pending_urls = []
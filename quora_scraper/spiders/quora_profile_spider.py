@@ -1,16 +1,101 @@
 import scrapy
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet.threads import deferToThread
 import time
 import logging
 import signal
-import sys
-from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode
-from selenium.webdriver.common.by import By
+import threading
+from urllib.parse import urlparse, urlunparse
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from ..items import QuoraAnswerItem
 from quora_scraper.database_sqlite import database_context
 from quora_scraper.chrome_driver_manager import get_chrome_manager
+from quora_scraper.common import evaluate_in_page
 
 logger = logging.getLogger(__name__)
 
+# Prefix shared by every answer URL - dropped from the keys of the dedup set to save memory
+QUORA_URL_PREFIX = "https://www.quora.com/"
+
+# Maximum time to wait for new content after each scroll
+SCROLL_WAIT_TIMEOUT = 1.0
+
+# Minimum seconds between terminal progress line updates
+PROGRESS_UPDATE_INTERVAL = 1.0
+
+# In incremental mode, stop after this many consecutive scrolls that only turned up links
+# already in the database - everything below that point was collected by an earlier run
+KNOWN_SCROLLS_BEFORE_STOP = 5
+
+# Returns answer link hrefs that appeared since the previous call, then scrolls to the bottom
+# and reports the page height. On the first call (or when reset is true) it scans the
+# page once and installs a MutationObserver that queues links as Quora inserts them, so later
+# calls only drain the queue instead of re-scanning the whole DOM. Fallback selectors are
+# tried while the primary selector itself has found very few links - links the fallbacks
+# pick up don't count, so they keep running if the primary selector stops matching.
+COLLECT_AND_SCROLL_SCRIPT = """
+(function (reset) {
+const PRIMARY_SELECTOR = 'a.answer_timestamp';
+if (reset || !window.__quoraLinkQueue) {
+    if (window.__quoraLinkObserver) {
+        window.__quoraLinkObserver.disconnect();
+    }
+    const seen = new Set();
+    const queue = [];
+    const enqueue = (a) => {
+        const href = a.href;
+        if (href && href.includes('/answer/') && !seen.has(href)) {
+            seen.add(href);
+            queue.push(href);
+            return true;
+        }
+        return false;
+    };
+    const enqueuePrimary = (a) => {
+        if (enqueue(a)) window.__quoraPrimaryLinkCount++;
+    };
+    const scan = (node) => {
+        if (node.nodeType !== Node.ELEMENT_NODE) return;
+        if (node.matches(PRIMARY_SELECTOR)) enqueuePrimary(node);
+        node.querySelectorAll(PRIMARY_SELECTOR).forEach(enqueuePrimary);
+    };
+    window.__quoraPrimaryLinkCount = 0;
+    scan(document.documentElement);
+    const observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            if (mutation.type === 'attributes') {
+                scan(mutation.target);
+            } else {
+                mutation.addedNodes.forEach(scan);
+            }
+        }
+    });
+    observer.observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ['href']});
+    window.__quoraLinkQueue = queue;
+    window.__quoraEnqueueLink = enqueue;
+    window.__quoraLinkObserver = observer;
+}
+if (window.__quoraPrimaryLinkCount < 10) {
+    for (const selector of [
+        "a[href*='/answer/']",
+        ".answer_content_wrapper a[href*='/answer/']",
+        "[class*='answer'] a[href*='/answer/']"
+    ]) {
+        document.querySelectorAll(selector).forEach(window.__quoraEnqueueLink);
+    }
+}
+const links = window.__quoraLinkQueue.splice(0);
+window.scrollTo(0, document.body.scrollHeight);
+return {links: links, height: document.body.scrollHeight};
+})(%s)
+"""
+
+
+def url_key(url):
+    """Key used for the database URL set - the URL without the common Quora prefix"""
+    return url.removeprefix(QUORA_URL_PREFIX)
+
 
 class QuoraProfileSpider(scrapy.Spider):
     """Spider to extract all answers from Kanthaswamy Balasubramaniam's Quora profile"""
@@ -29,12 +114,15 @@ class QuoraProfileSpider(scrapy.Spider):
         'AUTOTHROTTLE_TARGET_CONCURRENCY': 1.0,
     }
     
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, incremental=False, **kwargs):
         super().__init__(*args, **kwargs)
+        # Spider arguments given with -a arrive as strings
+        self.incremental = str(incremental).lower() in ('1', 'true', 'yes')
         self.chrome_manager = get_chrome_manager()
-        self.seen_answer_urls = set()
-        self.database_saved_urls = set()  # URLs already in database
+        self.database_saved_urls = set()  # url_key() of URLs already in database
         self.unsaved_links = set()  # Links collected but not yet saved to database
+        self.db_manager = None  # Database connection held open while collecting
+        self.shutdown_requested = threading.Event()  # Set by Ctrl+C, checked by the scroll loop
         self.answers_found = 0
         self.scroll_count = 0
         self.no_new_answers_count = 0
@@ -49,24 +137,14 @@ class QuoraProfileSpider(scrapy.Spider):
         """Handle graceful shutdown on Ctrl+C"""
         print("\n\n" + "="*70)
         print("GRACEFUL SHUTDOWN INITIATED")
+        print("Stopping after the current scroll - unsaved links will be saved first")
+        print("Press Ctrl+C again to stop immediately")
         print("="*70)
 
-        if self.unsaved_links:
-            print(f"Saving {len(self.unsaved_links)} unsaved links to database...")
-            self.save_batch_to_database(list(self.unsaved_links))
-            self.unsaved_links.clear()
-            print(f"✓ Links saved successfully")
-        else:
-            print("No unsaved links to save")
-
-        print(f"\nTotal links in database: {len(self.database_saved_urls)}")
-        print("="*70)
-
-        # Clean up Chrome driver
-        if self.chrome_manager:
-            self.chrome_manager.cleanup()
-
-        sys.exit(0)
+        # The scroll loop runs on a reactor thread and owns the unsaved links, the
+        # database connection and the driver, so it does the saving and stops itself
+        self.shutdown_requested.set()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
 
     def load_existing_urls_from_database(self):
         """Load all existing answered_question_url from database to avoid duplicates"""
@@ -77,7 +155,7 @@ class QuoraProfileSpider(scrapy.Spider):
             # Use context manager for database operations
             with database_context() as db:
                 # Get all existing URLs
-                self.database_saved_urls = db.get_all_answer_urls()
+                self.database_saved_urls = {url_key(url) for url in db.get_all_answer_urls()}
 
         except Exception as e:
             logger.error(f"Error loading existing URLs from database: {e}")
@@ -100,10 +178,15 @@ class QuoraProfileSpider(scrapy.Spider):
         # Call the parent start_requests to use the new start() method
         return super().start_requests()
     
-    def parse_with_selenium(self, response):
+    async def parse_with_selenium(self, response):
         """Parse answers page with resumable scrolling"""
+        # Scrolling blocks on Selenium for minutes, so run it on a thread to keep the reactor free
+        await maybe_deferred_to_future(deferToThread(self.collect_answer_links, response.url))
 
-        logger.info(f"Starting to process {response.url}")
+    def collect_answer_links(self, url):
+        """Collect and save all answer links from the profile page (runs on a worker thread)"""
+
+        logger.info(f"Starting to process {url}")
         logger.info(f"Database contains {len(self.database_saved_urls)} existing URLs to skip")
 
         # Setup Chrome driver first
@@ -111,6 +194,10 @@ class QuoraProfileSpider(scrapy.Spider):
             logger.error("Failed to setup Chrome driver")
             return
 
+        if self.shutdown_requested.is_set():
+            logger.info("Shutdown requested, skipping collection")
+            return
+
         # Now check authentication with the properly set up driver
         if not self.chrome_manager.is_authenticated():
             logger.error("Not authenticated to Quora. Please login in the browser first to authenticate.")
@@ -128,21 +215,31 @@ class QuoraProfileSpider(scrapy.Spider):
                 time.sleep(2)
             else:
                 logger.info("Navigating to profile page...")
-                self.chrome_manager.get_driver().get(response.url)
+                self.chrome_manager.get_driver().get(url)
                 time.sleep(5)  # Wait for initial page load
         except Exception as e:
             logger.warning(f"Could not check current URL, navigating to target: {e}")
-            self.chrome_manager.get_driver().get(response.url)
+            self.chrome_manager.get_driver().get(url)
             time.sleep(5)
         
-        # Collect all answer links by scrolling until complete
-        all_answer_links = self.scroll_until_complete()
+        # Only the answer links matter while scrolling, so skip images, fonts and media.
+        # This is the user's own browser tab, so the blocking is lifted again afterwards.
+        self.chrome_manager.block_heavy_resources()
+
+        # Collect all answer links by scrolling until complete, reusing one
+        # database connection for every batch save
+        with database_context() as db:
+            self.db_manager = db
+            try:
+                all_answer_links, new_found = self.scroll_until_complete()
+            finally:
+                self.db_manager = None
+                self.chrome_manager.unblock_resources()
         
         # Since we're now using batched saving during collection,
         # we mainly need to handle any final statistics
         total_found = len(all_answer_links)
-        total_existing = len([link for link in all_answer_links if link in self.database_saved_urls])
-        new_found = total_found - total_existing
+        total_existing = total_found - new_found
 
         logger.info(f"COLLECTION SUMMARY:")
         logger.info(f"  Total links found: {total_found}")
@@ -156,12 +253,14 @@ class QuoraProfileSpider(scrapy.Spider):
         # No need to yield items since we've bypassed the pipeline for efficiency
         
         logger.info(f"Total new answers found in this session: {self.answers_found}")
-        
-        # Clean up driver
-        self.chrome_manager.cleanup()
-        
+
+        # The driver stays connected until closed() so the session isn't torn down mid-crawl
+
     def scroll_until_complete(self):
-        """Scroll through the page until all content is loaded with proper batched saving"""
+        """Scroll through the page until all content is loaded with proper batched saving
+
+        Returns the links found and how many of them were not in the database yet
+        """
         logger.info("Starting comprehensive scrolling to collect all answer links")
 
         # Track all links seen and links not yet saved
@@ -169,19 +268,23 @@ class QuoraProfileSpider(scrapy.Spider):
         self.unsaved_links.clear()  # Clear any previous unsaved links
 
         # First, extract any links already visible on the page (for resume capability)
-        initial_links = self.extract_answer_links_from_selenium()
+        # The driver doesn't change during the scroll, so look it up once
+        driver = self.chrome_manager.get_driver()
+
+        initial_links, _ = self.collect_new_links_and_scroll(driver, reset=True)
         logger.info(f"Found {len(initial_links)} links already visible on page")
 
         # Add initial links and track unsaved ones
-        for link in initial_links:
-            all_links.add(link)
-            if link not in self.database_saved_urls:
-                self.unsaved_links.add(link)
+        all_links.update(initial_links)
+        self.unsaved_links.update(link for link in initial_links if url_key(link) not in self.database_saved_urls)
 
         logger.info(f"Starting with {len(self.unsaved_links)} unsaved links from current view")
 
+        # Links that weren't in the database when first seen - counted as we go, since
+        # database_saved_urls grows with every batch save
+        new_link_count = len(self.unsaved_links)
+
         start_time = time.time()
-        last_height = self.chrome_manager.get_driver().execute_script("return document.body.scrollHeight")
 
         # Enhanced end-detection counters
         scroll_attempts_without_new_content = 0
@@ -189,43 +292,54 @@ class QuoraProfileSpider(scrapy.Spider):
         total_scroll_attempts = 0
         batch_size = 200
         last_checkpoint_time = time.time()
+        last_progress_time = 0.0
         total_saved_this_session = 0
+        consecutive_known_scrolls = 0
 
         while True:
-            # Get current answer links
-            current_links = self.extract_answer_links_from_selenium()
-            links_before = len(all_links)
-
-            # Track new links found in this scroll
-            new_links_this_scroll = []
-            for link in current_links:
-                if link not in all_links:
-                    all_links.add(link)
-                    # Check if it's truly new (not in database)
-                    if link not in self.database_saved_urls:
-                        self.unsaved_links.add(link)
-                        new_links_this_scroll.append(link)
-
-            new_links_found = len(all_links) - links_before
+            if self.shutdown_requested.is_set():
+                print()  # New line before shutdown notice
+                logger.info("Shutdown requested, stopping the scroll")
+                break
+
+            # Get answer links that appeared since the last scroll, then scroll down to bottom
+            current_links, new_height = self.collect_new_links_and_scroll(driver)
+
+            # Track new links found in this scroll with set operations
+            new_links = set(current_links) - all_links
+            all_links |= new_links
+            # Only links not already in the database still need saving
+            unsaved_new_links = {link for link in new_links if url_key(link) not in self.database_saved_urls}
+            self.unsaved_links |= unsaved_new_links
+            new_link_count += len(unsaved_new_links)
+
+            # Count scrolls whose links were all already known; scrolls without links don't change it
+            if unsaved_new_links:
+                consecutive_known_scrolls = 0
+            elif new_links:
+                consecutive_known_scrolls += 1
+
+            new_links_found = len(new_links)
 
             total_scroll_attempts += 1
             elapsed_time = int(time.time() - start_time)
 
             # FIXED: Save batch when we have enough UNSAVED links
             if len(self.unsaved_links) >= batch_size:
-                links_to_save = list(self.unsaved_links)
-                logger.info(f"Saving batch of {len(links_to_save)} unsaved links...")
-                saved_count = self.save_batch_to_database(links_to_save)
+                logger.info(f"Saving batch of {len(self.unsaved_links)} unsaved links...")
+                saved_count = self.save_batch_to_database(self.unsaved_links)
                 if saved_count > 0:
                     # Update our tracking
-                    self.database_saved_urls.update(links_to_save)
+                    self.database_saved_urls.update(map(url_key, self.unsaved_links))
                     self.unsaved_links.clear()
                     total_saved_this_session += saved_count
                     print()  # New line for batch save notification
                     logger.info(f"✓ Batch saved: {saved_count} links (Total saved this session: {total_saved_this_session})")
 
-            # Log progress every 20 attempts or when new links found
-            if total_scroll_attempts % 20 == 0 or new_links_found > 0:
+            # Log progress every 20 attempts or when new links found, at most once per interval
+            now = time.monotonic()
+            if (total_scroll_attempts % 20 == 0 or new_links_found > 0) and now - last_progress_time >= PROGRESS_UPDATE_INTERVAL:
+                last_progress_time = now
                 rate = len(all_links) / elapsed_time if elapsed_time > 0 else 0
                 status = f"Scroll {total_scroll_attempts} (t={elapsed_time}s): Total: {len(all_links)} | Unsaved: {len(self.unsaved_links)} | Saved: {total_saved_this_session} | Rate: {rate:.1f}/s"
                 print(f"\r{status}", end="", flush=True)
@@ -242,31 +356,17 @@ class QuoraProfileSpider(scrapy.Spider):
             else:
                 attempts_without_new_links = 0
 
-            # Scroll down to bottom
-            self.chrome_manager.get_driver().execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-            # Optimized wait strategy: shorter initial waits, only wait longer when no new content
-            if new_links_found > 0:
-                # Content is still loading, short wait is sufficient
-                time.sleep(0.3)
-            elif scroll_attempts_without_new_content < 5:
-                # No new links but height might still be changing, medium wait
-                time.sleep(0.5)
+            # Wait for more content to load instead of sleeping a fixed time - returns as soon as the page grows
+            if self.wait_for_height_change(driver, new_height):
+                scroll_attempts_without_new_content = 0
             else:
-                # No new content for a while, slightly longer wait to check if more will load
-                time.sleep(1.0)
-
-            # Quick scroll to end again to catch any content that loaded during wait
-            self.chrome_manager.get_driver().execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-            # Calculate new scroll height
-            new_height = self.chrome_manager.get_driver().execute_script("return document.body.scrollHeight")
-
-            if new_height == last_height:
                 scroll_attempts_without_new_content += 1
-            else:
-                scroll_attempts_without_new_content = 0
-                last_height = new_height
+
+            # Incremental runs stop once scrolling only reaches previously collected answers
+            if self.incremental and consecutive_known_scrolls >= KNOWN_SCROLLS_BEFORE_STOP:
+                print()  # New line before end detection
+                logger.info(f"Reached previously collected answers: {consecutive_known_scrolls} scrolls found only known links")
+                break
 
             # Enhanced end-detection: Stop when multiple indicators suggest completion
             if (scroll_attempts_without_new_content >= 30 and
@@ -279,9 +379,9 @@ class QuoraProfileSpider(scrapy.Spider):
         if self.unsaved_links:
             print()  # New line before saving
             logger.info(f"Saving {len(self.unsaved_links)} remaining unsaved links...")
-            saved_count = self.save_final_batch_to_database(list(self.unsaved_links))
+            saved_count = self.save_final_batch_to_database(self.unsaved_links)
             if saved_count > 0:
-                self.database_saved_urls.update(self.unsaved_links)
+                self.database_saved_urls.update(map(url_key, self.unsaved_links))
                 total_saved_this_session += saved_count
                 self.unsaved_links.clear()
 
@@ -291,16 +391,14 @@ class QuoraProfileSpider(scrapy.Spider):
         logger.info(f"Total unique links found: {len(all_links)}")
         logger.info(f"Links saved this session: {total_saved_this_session}")
         logger.info(f"Total links in database: {len(self.database_saved_urls)}")
-        return list(all_links)
+        return list(all_links), new_link_count
 
     def save_batch_to_database(self, batch_urls):
         """Save a batch of URLs to database and return count of saved URLs"""
         try:
             # No need to filter here since we're tracking unsaved links properly now
             if batch_urls:
-                with database_context() as db:
-                    inserted_count = db.insert_answer_links_batch(batch_urls)
-                    return inserted_count
+                return self.db_manager.insert_answer_links_batch(batch_urls)
             return 0
         except Exception as e:
             logger.error(f"Error saving batch: {e}")
@@ -310,10 +408,9 @@ class QuoraProfileSpider(scrapy.Spider):
         """Save final batch and return count for statistics"""
         try:
             if final_urls:
-                with database_context() as db:
-                    inserted_count = db.insert_answer_links_batch(final_urls)
-                    logger.info(f"Final batch saved: {inserted_count} new URLs inserted")
-                    return inserted_count
+                inserted_count = self.db_manager.insert_answer_links_batch(final_urls)
+                logger.info(f"Final batch saved: {inserted_count} new URLs inserted")
+                return inserted_count
             return 0
         except Exception as e:
             logger.error(f"Error saving final batch: {e}")
@@ -321,6 +418,10 @@ class QuoraProfileSpider(scrapy.Spider):
 
     def clean_answer_url(self, url):
         """Remove query parameters like ?no_redirect=1 from answer URL"""
+        # a.href values are always absolute, so plain string splitting covers the common case
+        if url.startswith(('https://', 'http://')) and ';' not in url:
+            return url.split('#', 1)[0].split('?', 1)[0]
+
         try:
             parsed = urlparse(url)
             # Reconstruct URL without query parameters
@@ -330,44 +431,34 @@ class QuoraProfileSpider(scrapy.Spider):
             logger.warning(f"Error cleaning URL {url}: {e}")
             return url
 
-    def extract_answer_links_from_selenium(self):
-        """Extract answer links from current page state using Selenium with fallback selectors"""
+    def wait_for_height_change(self, driver, height, timeout=SCROLL_WAIT_TIMEOUT):
+        """Wait until the page grows beyond the given height, False if it doesn't within the timeout"""
+        if height is None:
+            time.sleep(timeout)
+            return False
+
         try:
-            links = []
-
-            # Primary selector
-            elements = self.chrome_manager.get_driver().find_elements(By.CSS_SELECTOR, "a.answer_timestamp")
-            for element in elements:
-                href = element.get_attribute('href')
-                if href and '/answer/' in href:
-                    clean_href = self.clean_answer_url(href)
-                    links.append(clean_href)
-
-            # Fallback selectors if primary doesn't work well
-            if len(links) < 10:  # If we found very few links, try alternatives
-                fallback_selectors = [
-                    "a[href*='/answer/']",
-                    ".answer_content_wrapper a[href*='/answer/']",
-                    "[class*='answer'] a[href*='/answer/']"
-                ]
-
-                for selector in fallback_selectors:
-                    try:
-                        fallback_elements = self.chrome_manager.get_driver().find_elements(By.CSS_SELECTOR, selector)
-                        for element in fallback_elements:
-                            href = element.get_attribute('href')
-                            if href and '/answer/' in href:
-                                clean_href = self.clean_answer_url(href)
-                                if clean_href not in links:
-                                    links.append(clean_href)
-                    except:
-                        continue
-
-            return links
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script("return document.body.scrollHeight") != height
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def collect_new_links_and_scroll(self, driver, reset=False):
+        """Return answer links that appeared since the last call and the page height, scrolling to the bottom"""
+        try:
+            # One CDP Runtime.evaluate collects only unseen hrefs, scrolls and reads the height
+            script = COLLECT_AND_SCROLL_SCRIPT % ('true' if reset else 'false')
+            result = evaluate_in_page(driver, script)
+
+            # dict.fromkeys drops duplicates while keeping page order
+            links = list(dict.fromkeys(self.clean_answer_url(href) for href in result.get('links', [])))
+            return links, result.get('height')
 
         except Exception as e:
             logger.error(f"Error extracting links with Selenium: {e}")
-            return []
+            return [], None
     
     def closed(self, reason):
         """Called when the spider closes"""
@@ -50,11 +50,11 @@ def create_sqlite_schema(sqlite_conn):
             post_timestamp_parsed TEXT
         )
     """)
-    
-    # Create index
+    # answered_question_url needs no extra index - the UNIQUE constraint creates one
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_answered_question_url 
-        ON quora_answers(answered_question_url)
+        CREATE INDEX IF NOT EXISTS idx_post_timestamp_parsed
+        ON quora_answers(post_timestamp_parsed)
+        WHERE post_timestamp_parsed IS NOT NULL
     """)
     
     sqlite_conn.commit()
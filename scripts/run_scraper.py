@@ -19,6 +19,27 @@ from quora_scraper.spiders.quora_profile_spider import QuoraProfileSpider
 from quora_scraper.answer_processor import run_answer_processor
 from quora_scraper.parallel_answer_processor import run_parallel_processor
 
+# Loggers whose startup chatter is hidden during collection, with the level they're raised to
+QUIET_LOGGERS = (
+    ('scrapy', logging.ERROR),
+    ('scrapy.utils.log', logging.ERROR),
+    ('scrapy.core.engine', logging.ERROR),
+    ('scrapy.addons', logging.ERROR),
+    ('scrapy.crawler', logging.ERROR),
+    ('scrapy.middleware', logging.ERROR),
+    ('asyncio', logging.ERROR),
+    ('scrapy.extensions', logging.ERROR),
+    ('scrapy.extensions.throttle', logging.ERROR),
+    ('scrapy.spidermiddlewares.httperror', logging.ERROR),
+    ('scrapy.downloadermiddlewares.cookies', logging.ERROR),
+    ('scrapy.statscollectors', logging.ERROR),
+    ('selenium', logging.ERROR),
+    ('selenium.webdriver.common.driver_finder', logging.ERROR),
+    ('selenium.webdriver.common.service', logging.ERROR),
+    ('quora_scraper.middlewares', logging.WARNING),
+    ('quora_scraper.chrome_driver_manager', logging.WARNING),
+)
+
 def setup_logging(log_file="quora_scraper.log"):
     """Setup logging configuration"""
     logging.basicConfig(
@@ -44,8 +65,12 @@ def check_environment():
         print("See .env.example for reference.")
         sys.exit(1)
 
-def run_collector():
-    """Run the Quora answer URL collector"""
+def run_collector(incremental=False):
+    """Run the Quora answer URL collector
+
+    Args:
+        incremental: Stop scrolling once only already-collected answers are showing up
+    """
     # Load environment variables
     load_dotenv()
     
@@ -69,23 +94,8 @@ def run_collector():
         settings.setmodule('quora_scraper.settings')
 
         # Suppress all verbose Scrapy startup logging
-        logging.getLogger('scrapy').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.utils.log').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.core.engine').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.addons').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.crawler').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.middleware').setLevel(logging.ERROR)
-        logging.getLogger('asyncio').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.extensions').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.extensions.throttle').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.spidermiddlewares.httperror').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.downloadermiddlewares.cookies').setLevel(logging.ERROR)
-        logging.getLogger('scrapy.statscollectors').setLevel(logging.ERROR)
-        logging.getLogger('selenium').setLevel(logging.ERROR)
-        logging.getLogger('selenium.webdriver.common.driver_finder').setLevel(logging.ERROR)
-        logging.getLogger('selenium.webdriver.common.service').setLevel(logging.ERROR)
-        logging.getLogger('quora_scraper.middlewares').setLevel(logging.WARNING)
-        logging.getLogger('quora_scraper.chrome_driver_manager').setLevel(logging.WARNING)
+        for logger_name, level in QUIET_LOGGERS:
+            logging.getLogger(logger_name).setLevel(level)
 
         # Override settings from environment if provided
         if os.getenv('SCRAPY_LOG_LEVEL'):
@@ -96,7 +106,7 @@ def run_collector():
 
         # Create and start the crawler process with custom log configuration
         process = CrawlerProcess(settings, install_root_handler=False)
-        process.crawl(QuoraProfileSpider)
+        process.crawl(QuoraProfileSpider, incremental=incremental)
         
         logger.info("Starting URL collection process...")
         process.start()  # This will block until crawling is finished
@@ -160,6 +170,7 @@ def main():
         Examples:
         python scripts/run_scraper.py                         # Collect new answer URLs (default)
         python scripts/run_scraper.py --mode collect          # Collect new answer URLs
+        python scripts/run_scraper.py --mode collect --incremental   # Stop at previously collected answers
         python scripts/run_scraper.py --mode process          # Process existing URLs sequentially
         python scripts/run_scraper.py --mode process --workers 3   # Process with 3 parallel workers
         python scripts/run_scraper.py --mode process --workers 5   # Process with 5 parallel workers (max)
@@ -180,7 +191,17 @@ def main():
         help='Number of parallel workers for processing mode (1-5, default: sequential processing)'
     )
     
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Collection mode: stop scrolling once only answers already in the database are found'
+    )
+
     args = parser.parse_args()
+
+    # Reject a bad worker count before any banner or prompt
+    if args.mode == 'process' and args.workers is not None and not 1 <= args.workers <= 5:
+        parser.error(f"--workers must be between 1 and 5, got {args.workers}")
     
     print("=" * 70)
     print("Quora Answer Scraper for Kanthaswamy Balasubramaniam")
@@ -196,7 +217,7 @@ def main():
         print("MODE: Answer Data Processing")
         if args.workers and args.workers > 1:
             print(f"PARALLEL PROCESSING: {args.workers} workers")
-            print(f"Chrome ports: {9223} - {9223 + args.workers - 1}")
+            print(f"Chrome port: 9223 ({args.workers} tabs)")
         else:
             print("SEQUENTIAL PROCESSING: Single worker")
         print("This will process existing answer URLs in the database and populate:")
@@ -230,26 +251,19 @@ def main():
         print("- Processing mode requires authenticated Chrome session(s)")
 
         if args.workers and args.workers > 1:
-            # Validate worker count
-            if args.workers > 5:
-                print(f"\nERROR: Maximum 5 workers allowed. You specified {args.workers}.")
-                sys.exit(1)
-
-            print(f"\nPARALLEL MODE: {args.workers} Chrome instances required")
-            print("- If Chrome instances are not already running, they will be started automatically")
-            print("- Ports to be used: ", end="")
-            ports = [str(9223 + i) for i in range(args.workers)]
-            print(", ".join(ports))
+            print(f"\nPARALLEL MODE: one Chrome instance with {args.workers} tabs")
+            print("- If Chrome is not already running on port 9223, it will be started automatically")
+            print("- Each worker drives its own tab in that Chrome instance")
             print()
-            print("To manually start Chrome instances (if needed):")
-            print(f"  python scripts/start_parallel_chrome.py -n {args.workers}")
+            print("To manually start Chrome (if needed):")
+            print("  python scripts/start_parallel_chrome.py -n 1")
         else:
             print("\nSEQUENTIAL MODE: Single Chrome instance")
             print("- If not already running, start Chrome with:")
             print("  /Applications/Google\\ Chrome.app/Contents/MacOS/Google\\ Chrome \\")
-            print("    --remote-debugging-port=9222 --user-data-dir=/tmp/chrome_debug_profile")
+            print("    --remote-debugging-port=9222 --user-data-dir=$HOME/.quora_scraper_profile")
 
-        print("\nAuthenticate to Quora in each Chrome instance if not already logged in.")
+        print("\nAuthenticate to Quora in the Chrome instance if not already logged in.")
         print()
 
         response = input("Continue with processing mode? (y/N): ")
@@ -259,7 +273,7 @@ def main():
     
     # Run the appropriate mode
     if args.mode == 'collect':
-        success = run_collector()
+        success = run_collector(incremental=args.incremental)
     else:
         success = run_processor(workers=args.workers)
     
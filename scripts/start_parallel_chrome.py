@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
-Helper script to start multiple Chrome instances for parallel processing
+Helper script to start Chrome with remote debugging for parallel processing
+
+The parallel processor runs every worker as a tab of the single Chrome on the
+base port (9223), so one instance (-n 1) is all it needs. Extra instances start
+on the following ports with their own profiles.
 """
 
 import os
@@ -11,6 +15,12 @@ import subprocess
 import argparse
 import requests
 import signal
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
+
+from quora_scraper.chrome_driver_manager import CHROME_PERFORMANCE_FLAGS, CHROME_PROFILE_DIR, find_chrome_path
 
 
 def check_chrome_running(port):
@@ -22,26 +32,29 @@ def check_chrome_running(port):
         return False
 
 
+def check_chrome_ports(ports):
+    """Check all ports at once and return {port: running} - each probe waits on the network"""
+    ports = list(ports)
+    if not ports:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        return dict(zip(ports, executor.map(check_chrome_running, ports)))
+
+
+def wait_for_chrome_ports(ports, timeout=10):
+    """Poll until every port answers or the timeout expires, returning the ports that came up"""
+    pending = set(ports)
+    deadline = time.time() + timeout
+    while pending and time.time() < deadline:
+        pending -= {port for port, running in check_chrome_ports(pending).items() if running}
+        if pending:
+            time.sleep(0.2)
+    return set(ports) - pending
+
+
 def start_chrome_instance(port, new_window=True):
     """Start a Chrome instance with remote debugging on specified port"""
-    is_mac_arm = platform.system() == 'Darwin' and platform.machine() == 'arm64'
-
-    if is_mac_arm:
-        chrome_path = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-    else:
-        chrome_path = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-        if not os.path.exists(chrome_path):
-            # Try common Chrome paths for Linux/Windows
-            possible_paths = [
-                '/usr/bin/google-chrome',
-                '/usr/bin/chromium-browser',
-                'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
-                'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe'
-            ]
-            for path in possible_paths:
-                if os.path.exists(path):
-                    chrome_path = path
-                    break
+    chrome_path = find_chrome_path()
 
     if not os.path.exists(chrome_path) and platform.system() != 'Windows':
         print(f"ERROR: Chrome not found at {chrome_path}")
@@ -52,7 +65,7 @@ def start_chrome_instance(port, new_window=True):
     chrome_cmd = [
         chrome_path,
         f'--remote-debugging-port={port}',
-        f'--user-data-dir=/tmp/chrome_debug_profile_{port}'
+        f'--user-data-dir={CHROME_PROFILE_DIR}_{port}'
     ]
 
     # Add new window flag if requested
@@ -62,7 +75,8 @@ def start_chrome_instance(port, new_window=True):
     chrome_cmd.extend([
         '--no-first-run',
         '--no-default-browser-check',
-        '--disable-default-apps'
+        '--disable-default-apps',
+        *CHROME_PERFORMANCE_FLAGS
     ])
 
     print(f"Starting Chrome on port {port}...")
@@ -84,22 +98,26 @@ def start_chrome_instance(port, new_window=True):
         return None
 
 
+def close_chrome(port):
+    """Ask Chrome on a port to close via CDP - a refused connection means nothing was running"""
+    try:
+        return requests.get(f'http://localhost:{port}/json/close', timeout=1).status_code == 200
+    except requests.RequestException:
+        return False
+
+
 def stop_all_chrome_instances(base_port=9223, num_instances=5):
     """Stop all Chrome instances by closing their debug connections"""
     print("\nStopping Chrome instances...")
     stopped = 0
 
-    for i in range(num_instances):
-        port = base_port + i
-        if check_chrome_running(port):
-            try:
-                # Try to close Chrome via CDP
-                response = requests.get(f'http://localhost:{port}/json/close', timeout=1)
-                if response.status_code == 200:
-                    print(f"  Stopped Chrome on port {port}")
-                    stopped += 1
-            except:
-                pass
+    # Send the close requests to all ports at once instead of checking each port first
+    ports = range(base_port, base_port + num_instances)
+    with ThreadPoolExecutor(max_workers=num_instances) as executor:
+        for port, closed in zip(ports, executor.map(close_chrome, ports)):
+            if closed:
+                print(f"  Stopped Chrome on port {port}")
+                stopped += 1
 
     if stopped > 0:
         print(f"Stopped {stopped} Chrome instance(s)")
@@ -109,12 +127,12 @@ def stop_all_chrome_instances(base_port=9223, num_instances=5):
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Start multiple Chrome instances for parallel Quora processing",
+        description="Start Chrome with remote debugging for parallel Quora processing",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
+  python scripts/start_parallel_chrome.py -n 1      # Start the Chrome shared by all workers (port 9223)
   python scripts/start_parallel_chrome.py           # Start 3 Chrome instances (default)
-  python scripts/start_parallel_chrome.py -n 5      # Start 5 Chrome instances
   python scripts/start_parallel_chrome.py --stop    # Stop all Chrome instances
   python scripts/start_parallel_chrome.py --check   # Check which ports have Chrome running
         """,
@@ -162,9 +180,8 @@ Examples:
     if args.check:
         print("Checking Chrome instances...")
         running = []
-        for i in range(5):
-            port = args.base_port + i
-            if check_chrome_running(port):
+        for port, is_running in check_chrome_ports(range(args.base_port, args.base_port + 5)).items():
+            if is_running:
                 running.append(port)
                 print(f"  Port {port}: ✓ Chrome running")
             else:
@@ -181,42 +198,44 @@ Examples:
     print("=" * 60)
 
     processes = []
-    started = 0
+    started_ports = []
     skipped = 0
 
+    already_running = check_chrome_ports(range(args.base_port, args.base_port + args.num_instances))
+
     for i in range(args.num_instances):
         port = args.base_port + i
 
         # Check if Chrome is already running on this port
-        if check_chrome_running(port):
+        if already_running[port]:
             print(f"Chrome already running on port {port} - skipping")
             skipped += 1
             continue
 
-        # Start new Chrome instance
+        # Start new Chrome instance - all instances launch before any is waited on
         process = start_chrome_instance(port, new_window=(i == 0))
         if process:
             processes.append(process)
-            started += 1
-
-            # Wait a bit for Chrome to start
-            time.sleep(2)
+            started_ports.append(port)
 
-            # Verify Chrome started
-            if check_chrome_running(port):
-                print(f"  ✓ Chrome started successfully on port {port}")
-            else:
-                print(f"  ✗ Chrome may have failed to start on port {port}")
+    # Verify Chrome started, waiting for all instances together
+    ready_ports = wait_for_chrome_ports(started_ports)
+    for port in started_ports:
+        if port in ready_ports:
+            print(f"  ✓ Chrome started successfully on port {port}")
+        else:
+            print(f"  ✗ Chrome may have failed to start on port {port}")
+    started = len(started_ports)
 
     print("=" * 60)
     print(f"Summary: {started} started, {skipped} skipped")
 
     if started > 0:
         print("\nChrome instances are running. You can now:")
-        print("1. Navigate to Quora.com in each window")
-        print("2. Login if needed (use same account)")
-        print("3. Run the parallel processor:")
-        print(f"   python scripts/run_scraper.py --mode process --workers {args.num_instances}")
+        print(f"1. Navigate to Quora.com in the Chrome on port {args.base_port}")
+        print("2. Login if needed")
+        print("3. Run the parallel processor (each worker opens its own tab in that Chrome):")
+        print("   python scripts/run_scraper.py --mode process --workers 3")
         print("\nPress Ctrl+C to stop all Chrome instances")
 
         # Wait for Ctrl+C
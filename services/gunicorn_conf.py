@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for the visualization API (used by quora-api.service)
+"""
+
+import multiprocessing
+
+bind = "0.0.0.0:8003"
+
+# Requests spend most of their time in SQLite reads and JSON encoding, so a few
+# threads per worker keep a slow request from blocking the others
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 4
+
+# Nginx proxies every /api/ request here, so keep its connections open
+keepalive = 30
@@ -7,9 +7,12 @@ import os
 import sys
 import logging
 from dotenv import load_dotenv
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 
 # Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
 
 from quora_scraper.answer_processor import QuoraAnswerProcessor
 from quora_scraper.chrome_driver_manager import ChromeDriverManager
@@ -77,8 +80,13 @@ def test_processor_connection():
             test_url = "https://www.quora.com/profile/Kanthaswamy-Balasubramaniam/answers"
             driver.get(test_url)
 
-            import time
-            time.sleep(3)
+            # Continue as soon as the page has loaded instead of sleeping a fixed time
+            try:
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+            except TimeoutException:
+                print("Page did not finish loading within 10 seconds")
 
             final_url = driver.current_url
             final_title = driver.title
@@ -15,18 +15,20 @@ def test_database():
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # Test basic query
-        cursor.execute("SELECT COUNT(*) FROM quora_answers WHERE post_timestamp_parsed IS NOT NULL")
-        count = cursor.fetchone()[0]
+        # Test basic query and sample data in one round trip
+        cursor.execute("""
+            SELECT COUNT(post_timestamp_parsed) AS parsed_count,
+                   (SELECT question_text FROM quora_answers WHERE question_text IS NOT NULL LIMIT 1) AS sample_question
+            FROM quora_answers
+        """)
+        row = cursor.fetchone()
+        count, sample_question = row['parsed_count'], row['sample_question']
 
         print(f"Database connection successful!")
         print(f"Found {count} records with parsed timestamps")
 
-        # Test sample data
-        cursor.execute("SELECT question_text FROM quora_answers WHERE question_text IS NOT NULL LIMIT 1")
-        sample = cursor.fetchone()
-        if sample:
-            print(f"Sample question: {sample[0][:100]}...")
+        if sample_question:
+            print(f"Sample question: {sample_question[:100]}...")
 
         cursor.close()
         conn.close()
@@ -58,7 +58,7 @@ def test_coordinator_setup():
 
     print(f"✓ Coordinator log directory: {processor.log_dir}")
     print(f"✓ Number of workers configured: {processor.num_workers}")
-    print(f"✓ Base debug port: {processor.base_debug_port}")
+    print(f"✓ Debug port: {processor.debug_port}")
 
     print("\nCheck that no coordinator logs appear in terminal above")
 
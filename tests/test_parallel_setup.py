@@ -6,54 +6,62 @@ Test script to verify parallel processing setup
 import sys
 import time
 import requests
-from quora_scraper.parallel_answer_processor import ParallelChromeManager
+from quora_scraper.parallel_answer_processor import ParallelChromeManager, ParallelAnswerProcessor
 
 
-def test_chrome_ports(num_workers=3):
-    """Test if Chrome instances can be reached on required ports"""
-    print(f"Testing Chrome setup for {num_workers} workers...")
+def test_chrome_port(debug_port):
+    """Test if the Chrome instance shared by all workers can be reached"""
+    print(f"Testing Chrome on port {debug_port}...")
     print("=" * 60)
 
-    base_port = 9223
-    available_ports = []
-    missing_ports = []
-
-    # Test ports from 9223 to 9223+num_workers-1
-    for i in range(num_workers):
-        port = base_port + i
-        try:
-            response = requests.get(f'http://localhost:{port}/json', timeout=2)
-            if response.status_code == 200:
-                print(f"✓ Port {port}: Chrome is running")
-                available_ports.append(port)
-            else:
-                print(f"✗ Port {port}: Chrome not responding properly")
-                missing_ports.append(port)
-        except Exception:
-            print(f"✗ Port {port}: Chrome not running")
-            missing_ports.append(port)
+    try:
+        response = requests.get(f'http://localhost:{debug_port}/json', timeout=2)
+        running = response.status_code == 200
+        if running:
+            print(f"✓ Port {debug_port}: Chrome is running")
+        else:
+            print(f"✗ Port {debug_port}: Chrome not responding properly")
+    except Exception:
+        print(f"✗ Port {debug_port}: Chrome not running")
+        running = False
 
     print("=" * 60)
 
-    if missing_ports:
-        print(f"\n⚠️  Missing Chrome instances on ports: {missing_ports}")
-        print("\nTo start Chrome instances, run:")
-        print(f"  python scripts/start_parallel_chrome.py -n {num_workers}")
+    if not running:
+        print("\nTo start the shared Chrome instance, run:")
+        print("  python scripts/start_parallel_chrome.py -n 1")
+    return running
+
+
+def test_worker_tabs(num_workers=3):
+    """Test if one tab per worker can be opened and closed in the shared Chrome"""
+    print(f"Testing worker tabs for {num_workers} workers...")
+
+    processor = ParallelAnswerProcessor(num_workers=num_workers)
+    try:
+        target_ids = processor.open_worker_tabs()
+    except Exception as e:
+        print(f"✗ Could not open worker tabs on port {processor.debug_port}: {e}")
         return False
-    else:
-        print(f"\n✅ All {num_workers} Chrome instances are running!")
-        return True
+
+    print(f"✓ Opened {len(target_ids)} worker tabs: {target_ids}")
+    processor.close_worker_tabs(target_ids)
+    print(f"✓ Closed {len(target_ids)} worker tabs")
+    return True
 
 
 def test_chrome_connection(port):
-    """Test if we can connect to a Chrome instance"""
+    """Test if a worker can connect to its own tab of the shared Chrome"""
     print(f"\nTesting connection to Chrome on port {port}...")
 
+    processor = ParallelAnswerProcessor(num_workers=1)
+    target_ids = []
     try:
-        manager = ParallelChromeManager(debug_port=port)
+        target_ids = processor.open_worker_tabs()
+        manager = ParallelChromeManager(debug_port=port, target_id=target_ids[0])
 
         if manager.connect_to_existing_chrome():
-            print(f"✓ Successfully connected to Chrome on port {port}")
+            print(f"✓ Successfully connected to worker tab on port {port}")
 
             # Check authentication
             manager.driver.get("https://www.quora.com")
@@ -73,33 +81,38 @@ def test_chrome_connection(port):
     except Exception as e:
         print(f"✗ Error connecting to Chrome on port {port}: {e}")
         return False
+    finally:
+        processor.close_worker_tabs(target_ids)
 
 
 def main():
     print("Parallel Processing Setup Test")
     print("=" * 60)
 
+    # All workers share one Chrome instance, each in its own tab
+    debug_port = ParallelAnswerProcessor(num_workers=1).debug_port
+
+    if not test_chrome_port(debug_port):
+        response = input("\nStart the shared Chrome instance now? (y/N): ")
+        if response.lower() != 'y':
+            return
+        import os
+        import subprocess
+
+        repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        subprocess.run([sys.executable, os.path.join(repo_root, "scripts", "start_parallel_chrome.py"), "-n", "1"])
+        time.sleep(5)  # Wait for Chrome to start
+        if not test_chrome_port(debug_port):
+            return
+
     # Test different worker configurations
     test_configs = [1, 3, 5]
 
     for num_workers in test_configs:
         print(f"\n📍 Testing {num_workers} worker(s) configuration:")
-        if test_chrome_ports(num_workers):
-            # Test connection to first port
-            test_chrome_connection(9223)
-            break
-        else:
-            response = input(f"\nStart {num_workers} Chrome instances now? (y/N): ")
-            if response.lower() == 'y':
-                import os
-                import subprocess
-
-                repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-                subprocess.run([sys.executable, os.path.join(repo_root, "scripts", "start_parallel_chrome.py"), "-n", str(num_workers)])
-                time.sleep(5)  # Wait for Chrome to start
-                if test_chrome_ports(num_workers):
-                    test_chrome_connection(9223)
-                    break
+        test_worker_tabs(num_workers)
+
+    test_chrome_connection(debug_port)
 
     print("\n" + "=" * 60)
     print("Test complete!")
@@ -1,90 +1,128 @@
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 import os
+import threading
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Rows fetched per round trip when streaming from a server-side cursor
+STREAM_BATCH_SIZE = 5000
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_connection_pool():
+    """Create the shared connection pool on first use and return it"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            database_url = os.getenv('DATABASE_URL')
+            if not database_url:
+                raise ValueError("DATABASE_URL environment variable is required")
+            _pool = psycopg2.pool.ThreadedConnectionPool(
+                1, int(os.getenv('PG_POOL_SIZE', '10')), database_url
+            )
+    return _pool
+
+@contextmanager
 def get_db_connection():
-    """Create and return a database connection"""
-    database_url = os.getenv('DATABASE_URL')
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable is required")
-    return psycopg2.connect(database_url)
+    """Borrow a connection from the pool, returning it when the block exits"""
+    pool = get_connection_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        # End the read transaction so the connection goes back clean
+        conn.rollback()
+        pool.putconn(conn)
+
+def get_data_version():
+    """Return a value that changes whenever quora_answers is written"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT n_tup_ins + n_tup_upd + n_tup_del
+            FROM pg_stat_user_tables
+            WHERE relname = 'quora_answers'
+        """)
+        row = cursor.fetchone()
+        cursor.close()
+
+    return str(row[0]) if row else '0'
 
 def get_timestamps_for_date_range(start_date_ist, end_date_ist):
-    """Get timestamps with question text and URLs for a date range"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-
-    query = """
-        SELECT post_timestamp_parsed, question_text, answered_question_url
-        FROM quora_answers
-        WHERE post_timestamp_parsed IS NOT NULL
-        AND post_timestamp_parsed >= %s
-        AND post_timestamp_parsed < %s
-        ORDER BY post_timestamp_parsed
-    """
-
-    cursor.execute(query, (start_date_ist.replace(tzinfo=None), end_date_ist.replace(tzinfo=None)))
-    results = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
-
-    return results
+    """Yield (timestamp, question_text, answered_question_url) tuples for a date range"""
+    with get_db_connection() as conn:
+        # Named cursors are server-side, so rows arrive in batches rather than all at once
+        cursor = conn.cursor(name='timestamps_for_date_range')
+        cursor.itersize = STREAM_BATCH_SIZE
+
+        query = """
+            SELECT post_timestamp_parsed, question_text, answered_question_url
+            FROM quora_answers
+            WHERE post_timestamp_parsed IS NOT NULL
+            AND post_timestamp_parsed >= %s
+            AND post_timestamp_parsed < %s
+            ORDER BY post_timestamp_parsed
+        """
+
+        try:
+            cursor.execute(query, (start_date_ist.replace(tzinfo=None), end_date_ist.replace(tzinfo=None)))
+            yield from cursor
+        finally:
+            cursor.close()
 
 def get_statistics():
     """Get overall statistics about timestamps"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-
-    # Get total count
-    cursor.execute("SELECT COUNT(*) as total FROM quora_answers WHERE post_timestamp_parsed IS NOT NULL")
-    total_count = cursor.fetchone()['total']
-
-    # Get date range
-    cursor.execute("""
-        SELECT
-            MIN(post_timestamp_parsed) as earliest,
-            MAX(post_timestamp_parsed) as latest
-        FROM quora_answers
-        WHERE post_timestamp_parsed IS NOT NULL
-    """)
-    date_range = cursor.fetchone()
-
-    # Get all timestamps for distribution calculations
-    cursor.execute("""
-        SELECT post_timestamp_parsed
-        FROM quora_answers
-        WHERE post_timestamp_parsed IS NOT NULL
-    """)
-    all_timestamps = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
+    with get_db_connection() as conn:
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+
+        # Get total count and date range in one pass
+        cursor.execute("""
+            SELECT
+                COUNT(*) as total,
+                MIN(post_timestamp_parsed) as earliest,
+                MAX(post_timestamp_parsed) as latest
+            FROM quora_answers
+            WHERE post_timestamp_parsed IS NOT NULL
+        """)
+        summary = cursor.fetchone()
+
+        # Count answers per half-hour UTC slot for the distribution calculations
+        cursor.execute("""
+            SELECT EXTRACT(EPOCH FROM post_timestamp_parsed)::bigint / 1800 AS slot, COUNT(*) AS count
+            FROM quora_answers
+            WHERE post_timestamp_parsed IS NOT NULL
+            GROUP BY slot
+        """)
+        half_hour_counts = cursor.fetchall()
+
+        cursor.close()
 
     return {
-        'total_count': total_count,
-        'earliest': date_range['earliest'],
-        'latest': date_range['latest'],
-        'all_timestamps': all_timestamps
+        'total_count': summary['total'],
+        'earliest': summary['earliest'],
+        'latest': summary['latest'],
+        'half_hour_counts': half_hour_counts
     }
 
 def get_all_timestamps():
-    """Get all timestamps with minimal processing"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-
-    cursor.execute("""
-        SELECT post_timestamp_parsed
-        FROM quora_answers
-        WHERE post_timestamp_parsed IS NOT NULL
-        ORDER BY post_timestamp_parsed
-    """)
-    results = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
-
-    return results
\ No newline at end of file
+    """Yield every timestamp in order"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor(name='all_timestamps')
+        cursor.itersize = STREAM_BATCH_SIZE
+
+        try:
+            cursor.execute("""
+                SELECT post_timestamp_parsed
+                FROM quora_answers
+                WHERE post_timestamp_parsed IS NOT NULL
+                ORDER BY post_timestamp_parsed
+            """)
+            for post_timestamp, in cursor:
+                yield post_timestamp
+        finally:
+            cursor.close()
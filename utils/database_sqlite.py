@@ -1,5 +1,6 @@
 import sqlite3
 import os
+import threading
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -9,6 +10,13 @@ load_dotenv()
 DEFAULT_SQLITE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "quora_answers.db")
 
 
+# post_timestamp_parsed as a UTC epoch. Values stored without an offset are IST,
+# the same assumption convert_to_timezone() makes.
+UTC_EPOCH_SQL = """CAST(strftime('%s', CASE
+    WHEN post_timestamp_parsed GLOB '*[+-][0-9][0-9]:[0-9][0-9]' OR post_timestamp_parsed GLOB '*Z'
+    THEN post_timestamp_parsed ELSE post_timestamp_parsed || '+05:30' END) AS INTEGER)"""
+
+
 def dict_factory(cursor, row):
     """Convert SQLite row to dictionary"""
     fields = [column[0] for column in cursor.description]
@@ -23,25 +31,44 @@ def get_db_connection():
     return conn
 
 
+_thread_local = threading.local()
+
+
+def get_thread_connection():
+    """Return this thread's shared read connection, opening it on first use"""
+    database_path = os.getenv('SQLITE_DB_PATH') or DEFAULT_SQLITE_PATH
+    if getattr(_thread_local, 'path', None) != database_path:
+        if getattr(_thread_local, 'conn', None) is not None:
+            _thread_local.conn.close()
+        _thread_local.conn = get_db_connection()
+        _thread_local.path = database_path
+    return _thread_local.conn
+
+
+def get_data_version():
+    """Return a value that changes whenever the database file is written"""
+    database_path = os.getenv('SQLITE_DB_PATH') or DEFAULT_SQLITE_PATH
+    stat = os.stat(database_path)
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
 def parse_timestamp(ts_str):
     """Parse timestamp string to datetime object"""
     if not ts_str:
         return None
     try:
-        # Handle ISO format with timezone
-        if '+' in ts_str or ts_str.endswith('Z'):
-            # Remove timezone for simplicity (SQLite stores as string)
-            ts_str = ts_str.replace('Z', '+00:00')
-            return datetime.fromisoformat(ts_str.replace(' ', 'T'))
+        # Handles the space separator, UTC offsets and a trailing 'Z' (Python 3.11+)
         return datetime.fromisoformat(ts_str)
     except (ValueError, TypeError):
         return None
 
 
 def get_timestamps_for_date_range(start_date_ist, end_date_ist):
-    """Get timestamps with question text and URLs for a date range"""
-    conn = get_db_connection()
+    """Yield (timestamp, question_text, answered_question_url) tuples for a date range"""
+    conn = get_thread_connection()
     cursor = conn.cursor()
+    # Plain tuples rather than dict rows - callers unpack the columns positionally
+    cursor.row_factory = None
 
     query = """
         SELECT post_timestamp_parsed, question_text, answered_question_url
@@ -56,79 +83,64 @@ def get_timestamps_for_date_range(start_date_ist, end_date_ist):
     start_str = str(start_date_ist.replace(tzinfo=None))
     end_str = str(end_date_ist.replace(tzinfo=None))
     
-    cursor.execute(query, (start_str, end_str))
-    results = cursor.fetchall()
-
-    # Parse timestamps back to datetime objects
-    for row in results:
-        row['post_timestamp_parsed'] = parse_timestamp(row['post_timestamp_parsed'])
-
-    cursor.close()
-    conn.close()
-
-    return results
+    try:
+        cursor.execute(query, (start_str, end_str))
+        # Parse timestamps back to datetime objects as rows are read
+        for post_timestamp, question_text, answered_question_url in cursor:
+            yield parse_timestamp(post_timestamp), question_text, answered_question_url
+    finally:
+        cursor.close()
 
 
 def get_statistics():
     """Get overall statistics about timestamps"""
-    conn = get_db_connection()
+    conn = get_thread_connection()
     cursor = conn.cursor()
 
-    # Get total count
-    cursor.execute("SELECT COUNT(*) as total FROM quora_answers WHERE post_timestamp_parsed IS NOT NULL")
-    total_count = cursor.fetchone()['total']
-
-    # Get date range
+    # Get total count and date range in one pass
     cursor.execute("""
         SELECT
+            COUNT(*) as total,
             MIN(post_timestamp_parsed) as earliest,
             MAX(post_timestamp_parsed) as latest
         FROM quora_answers
         WHERE post_timestamp_parsed IS NOT NULL
     """)
-    date_range = cursor.fetchone()
+    summary = cursor.fetchone()
 
-    # Get all timestamps for distribution calculations
-    cursor.execute("""
-        SELECT post_timestamp_parsed
+    # Count answers per half-hour UTC slot for the distribution calculations
+    cursor.execute(f"""
+        SELECT {UTC_EPOCH_SQL} / 1800 AS slot, COUNT(*) AS count
         FROM quora_answers
         WHERE post_timestamp_parsed IS NOT NULL
+        GROUP BY slot
     """)
-    all_timestamps = cursor.fetchall()
-
-    # Parse timestamps
-    for row in all_timestamps:
-        row['post_timestamp_parsed'] = parse_timestamp(row['post_timestamp_parsed'])
+    half_hour_counts = cursor.fetchall()
 
     cursor.close()
-    conn.close()
 
     return {
-        'total_count': total_count,
-        'earliest': parse_timestamp(date_range['earliest']),
-        'latest': parse_timestamp(date_range['latest']),
-        'all_timestamps': all_timestamps
+        'total_count': summary['total'],
+        'earliest': parse_timestamp(summary['earliest']),
+        'latest': parse_timestamp(summary['latest']),
+        'half_hour_counts': half_hour_counts
     }
 
 
 def get_all_timestamps():
-    """Get all timestamps with minimal processing"""
-    conn = get_db_connection()
+    """Yield every parsed timestamp in order"""
+    conn = get_thread_connection()
     cursor = conn.cursor()
+    cursor.row_factory = None
 
-    cursor.execute("""
-        SELECT post_timestamp_parsed
-        FROM quora_answers
-        WHERE post_timestamp_parsed IS NOT NULL
-        ORDER BY post_timestamp_parsed
-    """)
-    results = cursor.fetchall()
-
-    # Parse timestamps
-    for row in results:
-        row['post_timestamp_parsed'] = parse_timestamp(row['post_timestamp_parsed'])
-
-    cursor.close()
-    conn.close()
-
-    return results
+    try:
+        cursor.execute("""
+            SELECT post_timestamp_parsed
+            FROM quora_answers
+            WHERE post_timestamp_parsed IS NOT NULL
+            ORDER BY post_timestamp_parsed
+        """)
+        for post_timestamp, in cursor:
+            yield parse_timestamp(post_timestamp)
+    finally:
+        cursor.close()
@@ -1,5 +1,5 @@
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 # Timezone mappings
 TIMEZONES = {
@@ -9,70 +9,103 @@ TIMEZONES = {
     'EST': 'America/New_York'    # UTC-5:00 (varies with DST)
 }
 
+# Resolved once so per-row conversions skip the name lookup
+TZ_OBJECTS = {name: ZoneInfo(zone) for name, zone in TIMEZONES.items()}
+IST_TZ = TZ_OBJECTS['IST']
+
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
 def convert_to_timezone(timestamp, target_tz_name):
     """Convert timestamp to target timezone"""
     if timestamp is None:
         return None
 
-    target_tz = pytz.timezone(TIMEZONES.get(target_tz_name, 'Asia/Kolkata'))
-    ist_tz = pytz.timezone('Asia/Kolkata')
+    target_tz = TZ_OBJECTS.get(target_tz_name, IST_TZ)
 
     # If timestamp is naive, assume it's in IST (as per database storage)
     if timestamp.tzinfo is None:
-        timestamp = ist_tz.localize(timestamp)
+        timestamp = timestamp.replace(tzinfo=IST_TZ)
     elif timestamp.tzinfo.utcoffset(timestamp) is None:
         # If tzinfo exists but no offset, replace with IST
-        timestamp = ist_tz.localize(timestamp.replace(tzinfo=None))
+        timestamp = timestamp.replace(tzinfo=IST_TZ)
 
     # Convert to target timezone
     return timestamp.astimezone(target_tz)
 
+def format_timestamp_rows(rows, timezone_name):
+    """Convert (timestamp, question_text, answer_url) rows to the entries returned by /api/timestamps"""
+    timestamps = []
+    for timestamp, question_text, answer_url in rows:
+        converted = convert_to_timezone(timestamp, timezone_name)
+        if converted:
+            timestamps.append({
+                'datetime': converted.isoformat(),
+                'day': WEEKDAY_NAMES[converted.weekday()],
+                'hour': converted.hour,
+                'minute': converted.minute,
+                'date': converted.date().isoformat(),
+                'question_text': question_text or 'No question text',
+                'answer_url': answer_url or '#'
+            })
+    return timestamps
+
+def convert_timestamps_to_iso(timestamps, timezone_name):
+    """Convert timestamps to ISO strings in the target timezone"""
+    return [
+        convert_to_timezone(timestamp, timezone_name).isoformat()
+        for timestamp in timestamps
+        if timestamp is not None
+    ]
+
 def get_date_range_for_timezone(start_date_str, end_date_str, timezone_name):
     """Parse and convert date range for database queries"""
     if start_date_str and end_date_str:
-        start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
+        # fromisoformat accepts the trailing 'Z' from JavaScript's toISOString() (Python 3.11+);
+        # malformed input raises ValueError
+        start_date = datetime.fromisoformat(start_date_str)
+        end_date = datetime.fromisoformat(end_date_str)
     else:
         # Default to current week in the selected timezone
-        selected_tz = pytz.timezone(TIMEZONES.get(timezone_name, 'Asia/Kolkata'))
+        selected_tz = TZ_OBJECTS.get(timezone_name, IST_TZ)
         now = datetime.now(selected_tz)
         start_date = now - timedelta(days=now.weekday())
         start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_date = start_date + timedelta(days=7)
 
     # Convert date range to IST for database query (since DB stores in IST)
-    ist_tz = pytz.timezone('Asia/Kolkata')
     if start_date.tzinfo:
-        start_date_ist = start_date.astimezone(ist_tz)
-        end_date_ist = end_date.astimezone(ist_tz)
+        start_date_ist = start_date.astimezone(IST_TZ)
+        end_date_ist = end_date.astimezone(IST_TZ)
     else:
         # If no timezone info, assume UTC
-        start_date_ist = pytz.UTC.localize(start_date).astimezone(ist_tz)
-        end_date_ist = pytz.UTC.localize(end_date).astimezone(ist_tz)
+        start_date_ist = start_date.replace(tzinfo=timezone.utc).astimezone(IST_TZ)
+        end_date_ist = end_date.replace(tzinfo=timezone.utc).astimezone(IST_TZ)
 
     return start_date, end_date, start_date_ist, end_date_ist
 
-def calculate_distributions(all_timestamps, timezone_name):
-    """Calculate hourly and weekday distributions for the target timezone"""
+def calculate_distributions(half_hour_counts, timezone_name):
+    """Calculate hourly and weekday distributions for the target timezone
+
+    half_hour_counts holds rows of {'slot', 'count'}, where slot is the UTC epoch
+    divided by 1800. Every supported timezone offset and DST change falls on a
+    half-hour boundary, so each slot maps onto exactly one local hour.
+    """
     hourly_dist = {hour: 0 for hour in range(24)}
     weekday_dist = {day: 0 for day in range(7)}  # 0=Monday, 6=Sunday
 
-    for row in all_timestamps:
-        timestamp = row['post_timestamp_parsed']
-        converted = convert_to_timezone(timestamp, timezone_name)
-        if converted:
-            hourly_dist[converted.hour] += 1
-            weekday_dist[converted.weekday()] += 1
+    for row in half_hour_counts:
+        slot_start = datetime.fromtimestamp(row['slot'] * 1800, timezone.utc)
+        converted = convert_to_timezone(slot_start, timezone_name)
+        hourly_dist[converted.hour] += row['count']
+        weekday_dist[converted.weekday()] += row['count']
 
     # Find busiest hour and day
     busiest_hour = max(hourly_dist, key=hourly_dist.get)
     busiest_day = max(weekday_dist, key=weekday_dist.get)
 
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-
     return {
         'hourly_distribution': hourly_dist,
-        'weekday_distribution': {days[i]: count for i, count in weekday_dist.items()},
+        'weekday_distribution': {WEEKDAY_NAMES[i]: count for i, count in weekday_dist.items()},
         'busiest_hour': busiest_hour,
-        'busiest_day': days[busiest_day]
+        'busiest_day': WEEKDAY_NAMES[busiest_day]
     }
\ No newline at end of file
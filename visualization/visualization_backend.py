@@ -7,16 +7,78 @@ from dotenv import load_dotenv
 # Add the project root to Python path so we can import utils
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.database_sqlite import get_timestamps_for_date_range, get_statistics, get_all_timestamps
+from utils.database_sqlite import (
+    get_timestamps_for_date_range, get_statistics, get_all_timestamps, get_data_version
+)
 from utils.timezone_utils import (
-    convert_to_timezone, get_date_range_for_timezone,
-    calculate_distributions, TIMEZONES
+    convert_to_timezone, convert_timestamps_to_iso, format_timestamp_rows,
+    get_date_range_for_timezone, calculate_distributions, TIMEZONES
 )
 
 load_dotenv()
 
 app = Flask(__name__)
-CORS(app)
+# Skip key sorting and indentation when encoding the large timestamp payloads
+app.json.sort_keys = False
+app.json.compact = True
+# Production serves the UI and API from one origin through nginx; cross-origin
+# access is only needed by the dev server, and browsers may cache preflights for a day
+CORS(app, resources={r"/api/*": {"origins": os.getenv('UI_ORIGIN', 'http://localhost:3000')}}, max_age=86400)
+
+# Serialized JSON bodies keyed by (builder, timezone), each stored with the
+# database version it was built from
+_response_cache = {}
+
+def cached_json_response(build_payload, timezone_name):
+    """Serve build_payload's JSON, rebuilding it only after the database changes"""
+    data_version = get_data_version()
+    cache_key = (build_payload.__name__, timezone_name)
+    cached = _response_cache.get(cache_key)
+    if cached is None or cached[0] != data_version:
+        cached = (data_version, jsonify(build_payload(timezone_name)).get_data())
+        _response_cache[cache_key] = cached
+
+    response = app.response_class(cached[1], mimetype='application/json')
+    response.set_etag(f"{data_version}-{build_payload.__name__}-{timezone_name}")
+    return response.make_conditional(request)
+
+def build_stats(timezone_name):
+    """Build the /api/stats payload for a timezone"""
+    # Get data from database using shared utility
+    stats_data = get_statistics()
+
+    # Calculate distributions in the target timezone using shared utility
+    distributions = calculate_distributions(stats_data['half_hour_counts'], timezone_name)
+
+    # Convert earliest and latest to target timezone
+    earliest = convert_to_timezone(stats_data['earliest'], timezone_name) if stats_data['earliest'] else None
+    latest = convert_to_timezone(stats_data['latest'], timezone_name) if stats_data['latest'] else None
+
+    return {
+        'success': True,
+        'stats': {
+            'total_count': stats_data['total_count'],
+            'earliest_date': earliest.isoformat() if earliest else None,
+            'latest_date': latest.isoformat() if latest else None,
+            'busiest_hour': distributions['busiest_hour'],
+            'busiest_day': distributions['busiest_day'],
+            'hourly_distribution': distributions['hourly_distribution'],
+            'weekday_distribution': distributions['weekday_distribution'],
+            'timezone': timezone_name
+        }
+    }
+
+def build_all_timestamps(timezone_name):
+    """Build the /api/timestamps/all payload for a timezone"""
+    # Get data from database and convert to target timezone using shared utilities
+    timestamps = convert_timestamps_to_iso(get_all_timestamps(), timezone_name)
+
+    return {
+        'success': True,
+        'timestamps': timestamps,
+        'count': len(timestamps),
+        'timezone': timezone_name
+    }
 
 @app.route('/api/timestamps', methods=['GET'])
 def get_timestamps():
@@ -37,28 +99,21 @@ def get_timestamps():
             timezone_name = 'IST'
 
         # Get date range using shared utility
-        start_date, end_date, start_date_ist, end_date_ist = get_date_range_for_timezone(
-            start_date_str, end_date_str, timezone_name
-        )
+        try:
+            start_date, end_date, start_date_ist, end_date_ist = get_date_range_for_timezone(
+                start_date_str, end_date_str, timezone_name
+            )
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'start_date and end_date must be ISO 8601 timestamps'
+            }), 400
 
         # Get data from database using shared utility
         results = get_timestamps_for_date_range(start_date_ist, end_date_ist)
 
         # Convert timestamps to target timezone and format
-        timestamps = []
-        for row in results:
-            timestamp = row['post_timestamp_parsed']
-            converted = convert_to_timezone(timestamp, timezone_name)
-            if converted:
-                timestamps.append({
-                    'datetime': converted.isoformat(),
-                    'day': converted.strftime('%A'),
-                    'hour': converted.hour,
-                    'minute': converted.minute,
-                    'date': converted.strftime('%Y-%m-%d'),
-                    'question_text': row['question_text'] or 'No question text',
-                    'answer_url': row['answered_question_url'] or '#'
-                })
+        timestamps = format_timestamp_rows(results, timezone_name)
 
         return jsonify({
             'success': True,
@@ -87,29 +142,7 @@ def get_stats():
         if timezone_name not in TIMEZONES:
             timezone_name = 'IST'
 
-        # Get data from database using shared utility
-        stats_data = get_statistics()
-
-        # Calculate distributions in the target timezone using shared utility
-        distributions = calculate_distributions(stats_data['all_timestamps'], timezone_name)
-
-        # Convert earliest and latest to target timezone
-        earliest = convert_to_timezone(stats_data['earliest'], timezone_name) if stats_data['earliest'] else None
-        latest = convert_to_timezone(stats_data['latest'], timezone_name) if stats_data['latest'] else None
-
-        return jsonify({
-            'success': True,
-            'stats': {
-                'total_count': stats_data['total_count'],
-                'earliest_date': earliest.isoformat() if earliest else None,
-                'latest_date': latest.isoformat() if latest else None,
-                'busiest_hour': distributions['busiest_hour'],
-                'busiest_day': distributions['busiest_day'],
-                'hourly_distribution': distributions['hourly_distribution'],
-                'weekday_distribution': distributions['weekday_distribution'],
-                'timezone': timezone_name
-            }
-        })
+        return cached_json_response(build_stats, timezone_name)
 
     except Exception as e:
         return jsonify({
@@ -129,23 +162,7 @@ def get_all_timestamps_route():
         if timezone_name not in TIMEZONES:
             timezone_name = 'IST'
 
-        # Get data from database using shared utility
-        results = get_all_timestamps()
-
-        # Convert to target timezone
-        timestamps = []
-        for row in results:
-            timestamp = row['post_timestamp_parsed']
-            converted = convert_to_timezone(timestamp, timezone_name)
-            if converted:
-                timestamps.append(converted.isoformat())
-
-        return jsonify({
-            'success': True,
-            'timestamps': timestamps,
-            'count': len(timestamps),
-            'timezone': timezone_name
-        })
+        return cached_json_response(build_all_timestamps, timezone_name)
 
     except Exception as e:
         return jsonify({
@@ -162,4 +179,5 @@ def health_check():
     })
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    # The reloader and debugger are opt-in; set FLASK_DEBUG=1 when developing
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', port=int(os.getenv('PORT', '5000')), threaded=True)
\ No newline at end of file